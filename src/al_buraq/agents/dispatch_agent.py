@@ -6,7 +6,7 @@ Core dispatching logic with halal compliance and transparent commission.
 
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 import random
 
 from ..models.load import Load, Location, TimeWindow, LoadDimensions, BrokerInfo
@@ -249,8 +249,26 @@ class DispatchAgent:
         Returns:
             List of DispatchRecommendation
         """
-        recommendations = []
+        return list(self.iter_recommendations(loads, matches_per_load))
 
+    def iter_recommendations(
+        self,
+        loads: list[Load],
+        matches_per_load: int = 3,
+    ) -> Iterator[DispatchRecommendation]:
+        """
+        Yield dispatch recommendations one load at a time.
+
+        Same results as generate_recommendations, but each load is matched
+        only when the caller asks for it, so results can be streamed.
+
+        Args:
+            loads: Loads to process
+            matches_per_load: Max matches per load
+
+        Yields:
+            DispatchRecommendation per load, in order
+        """
         for load in loads:
             # Check halal status
             halal_result = check_commodity(load.commodity)
@@ -276,9 +294,7 @@ class DispatchAgent:
                     halal_reason=halal_result.reason,
                 )
 
-            recommendations.append(rec)
-
-        return recommendations
+            yield rec
 
     def create_sample_loads(self, count: int = 5) -> list[Load]:
         """Create sample loads for testing dispatch functionality."""
@@ -369,6 +385,12 @@ class DispatchAgent:
 
         return loads
 
+    def get_loads(self, load_count: int = 5, use_sample_loads: bool = True) -> list[Load]:
+        """Get available loads, or sample loads if ``use_sample_loads``."""
+        if use_sample_loads:
+            return self.create_sample_loads(load_count)
+        return self.repository.list_available_loads(limit=load_count)
+
     def run_dispatch_session(
         self,
         load_count: int = 5,
@@ -389,12 +411,7 @@ class DispatchAgent:
         start_time = datetime.utcnow()
         session = DispatchSession()
 
-        # Get or create loads
-        if use_sample_loads:
-            loads = self.create_sample_loads(load_count)
-        else:
-            loads = self.repository.list_available_loads(limit=load_count)
-
+        loads = self.get_loads(load_count, use_sample_loads)
         session.total_loads = len(loads)
 
         # Generate recommendations
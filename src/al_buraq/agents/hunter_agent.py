@@ -135,16 +135,35 @@ class HunterAgent:
         # Determine which sources to use
         active_sources = sources or list(self.hunters.keys())
 
+        known_sources = []
         for source_name in active_sources:
             if source_name not in self.hunters:
                 session.errors.append(f"Unknown source: {source_name}")
-                continue
+            else:
+                known_sources.append(source_name)
+
+        # Hunt all sources concurrently (each hunter rate-limits its own
+        # host), then process their leads one source at a time
+        results = await asyncio.gather(
+            *(
+                self.hunters[source_name].hunt(limit=limit_per_source, **kwargs)
+                for source_name in known_sources
+            ),
+            return_exceptions=True,
+        )
 
-            hunter = self.hunters[source_name]
+        # Cancellation and interrupts are not per-source failures; stop the hunt
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+        for source_name, result in zip(known_sources, results):
+            if isinstance(result, Exception):
+                session.errors.append(f"Error hunting from {source_name}: {result}")
+                session.total_errors += 1
+                continue
 
             try:
-                # Hunt from this source
-                result = await hunter.hunt(limit=limit_per_source, **kwargs)
                 session.source_results[source_name] = result.to_dict()
                 session.total_found += result.total_found
 
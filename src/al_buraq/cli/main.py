@@ -15,7 +15,7 @@ from rich.table import Table
 from rich.panel import Panel
 from rich import print as rprint
 
-from ..config import settings
+from ..config import settings, uvicorn_log_config
 
 # Fix Windows console encoding
 if sys.platform == "win32":
@@ -393,6 +393,9 @@ def serve(
     host: str = typer.Option("0.0.0.0", "--host", "-h", help="Host to bind to"),
     port: int = typer.Option(8000, "--port", "-p", help="Port to bind to"),
     reload: bool = typer.Option(False, "--reload", "-r", help="Enable auto-reload on code changes"),
+    workers: int = typer.Option(
+        settings.API_WORKERS, "--workers", "-w", help="Worker processes (ignored with --reload)"
+    ),
 ):
     """
     Start the Al-Buraq API server.
@@ -413,12 +416,14 @@ def serve(
         alburaq serve
         alburaq serve --port 3000
         alburaq serve --reload (for development)
+        alburaq serve --workers 4 (one process per core in production)
 
     DEPLOYMENT:
         For production deployment, consider:
         - Railway.app (free tier, GitHub integration)
         - Render.com (free tier, auto-detect FastAPI)
         - Fly.io (flyctl launch)
+        Each worker keeps its own agents, /v1/stats cache and verify lock.
     """
     import uvicorn
 
@@ -441,8 +446,10 @@ def serve(
             "al_buraq.server:app",
             host=host,
             port=port,
+            workers=workers,
             reload=reload,
             log_level="info",
+            log_config=uvicorn_log_config(),
         )
     except KeyboardInterrupt:
         console.print("\n[yellow]Server stopped by user[/yellow]")
@@ -1350,6 +1357,7 @@ def import_csv(
     limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Maximum leads to import"),
     chunk_size: int = typer.Option(1000, "--chunk-size", help="Rows per chunk for memory efficiency"),
     no_save: bool = typer.Option(False, "--no-save", help="Don't save to database (preview only)"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Worker processes for row conversion"),
 ):
     """
     Import leads from an FMCSA CSV file.
@@ -1361,6 +1369,7 @@ def import_csv(
     Examples:
         alburaq import-csv fmcsa_data.csv --limit 100
         alburaq import-csv carriers.csv --limit 500 --chunk-size 2000
+        alburaq import-csv fmcsa_census.csv --workers 4
     """
     from pathlib import Path
     from ..hunters import CSVHunter
@@ -1427,6 +1436,7 @@ def import_csv(
             require_email=True,
             save_to_db=not no_save,
             progress_callback=progress_callback,
+            workers=workers,
         )
     except Exception as e:
         console.print(f"\n[red]Import error: {e}[/red]")
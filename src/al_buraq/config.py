@@ -1,5 +1,6 @@
 """Configuration management for Al-Buraq dispatch system."""
 
+import copy
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
@@ -94,8 +95,18 @@ class Settings(BaseSettings):
     # ==========================================================================
     HUNTER_BATCH_SIZE: int = 50  # Leads to process per batch
     HUNTER_RATE_LIMIT_DELAY: float = 1.0  # Seconds between requests
+    HUNTER_MAX_CONCURRENCY: int = 64  # Carrier conversions in flight per hunt
+    HUNTER_AUTHORITY_CACHE_SIZE: int = 10_000  # Authority checks kept in memory
+    HUNTER_AUTHORITY_CACHE_TTL: int = 3600  # Seconds before re-checking SAFER
     HUNTER_MAX_AUTHORITY_AGE_DAYS: int = 730  # 2 years max
 
+    # ==========================================================================
+    # API Server
+    # ==========================================================================
+    API_STATS_CACHE_TTL: int = 30  # Seconds a /v1/stats response is reused (0 = off)
+    API_WORKERS: int = 1  # uvicorn worker processes (ignored with reload)
+    API_RELOAD: bool = False  # Auto-reload on code changes (development only)
+
     # ==========================================================================
     # Paths
     # ==========================================================================
@@ -143,6 +154,20 @@ def get_settings() -> Settings:
 settings = get_settings()
 
 
+def uvicorn_log_config() -> dict:
+    """
+    uvicorn's default logging config, extended to the al_buraq loggers.
+
+    uvicorn only installs handlers for its own loggers; module loggers
+    (logging.getLogger(__name__)) under al_buraq share its console handler.
+    """
+    from uvicorn.config import LOGGING_CONFIG
+
+    config = copy.deepcopy(LOGGING_CONFIG)
+    config["loggers"]["al_buraq"] = {"handlers": ["default"], "level": "INFO", "propagate": False}
+    return config
+
+
 # ==========================================================================
 # Haram Keywords (from MISSION.md)
 # ==========================================================================
@@ -16,12 +16,13 @@ from sqlalchemy import (
     DateTime,
     Text,
     Index,
+    text,
 )
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 
 from ..config import settings
 from ..models import Lead, Carrier, Load
-from ..models.enums import LeadStatus, CarrierStatus, LoadStatus
+from ..models.enums import EquipmentType, LeadStatus, CarrierStatus, LoadStatus
 
 Base = declarative_base()
 
@@ -106,9 +107,45 @@ class LeadRecord(Base):
     __table_args__ = (
         Index("ix_leads_score_status", "lead_score", "status"),
         Index("ix_leads_state_equipment", "home_base_state", "equipment_types"),
+        # get_verified_leads: filter on all three flags, read in score order
+        Index(
+            "ix_leads_verified_flags",
+            "verification_status", "social_verified", "high_intent", "lead_score",
+        ),
     )
 
 
+# Columns read by Repository.get_verified_lead_rows
+_VERIFIED_LISTING_COLUMNS = (
+    LeadRecord.id,
+    LeadRecord.company_name,
+    LeadRecord.mc_number,
+    LeadRecord.owner_name,
+    LeadRecord.email,
+    LeadRecord.phone_primary,
+    LeadRecord.home_base_state,
+    LeadRecord.truck_count,
+    LeadRecord.equipment_types,
+    LeadRecord.lead_score,
+    LeadRecord.social_verified,
+    LeadRecord.high_intent,
+    LeadRecord.linkedin_url,
+    LeadRecord.facebook_url,
+    LeadRecord.website_url,
+    LeadRecord.verification_status,
+    LeadRecord.created_at,
+)
+
+
+def _equipment_values(raw: Optional[str]) -> list[str]:
+    """Decode the equipment_types column, including rows saved as 'EquipmentType.X'."""
+    values = json.loads(raw) if raw else []
+    return [
+        EquipmentType[v.split(".", 1)[1]].value if v.startswith("EquipmentType.") else v
+        for v in values
+    ]
+
+
 class CarrierRecord(Base):
     """SQLAlchemy model for carriers table."""
 
@@ -251,13 +288,22 @@ class Repository:
         self.SessionLocal = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
 
     def init_db(self) -> None:
-        """Create all tables."""
+        """Create all tables, and any indexes added since they were created."""
         Base.metadata.create_all(self.engine)
+        # create_all skips indexes on tables that already exist
+        for index in LeadRecord.__table__.indexes:
+            if index.name == "ix_leads_verified_flags":
+                index.create(self.engine, checkfirst=True)
 
     def get_session(self) -> Session:
         """Get a new database session."""
         return self.SessionLocal()
 
+    def ping(self) -> None:
+        """Run a trivial query; raises if the database is unreachable."""
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
     # =========================================================================
     # Lead Operations
     # =========================================================================
@@ -406,6 +452,25 @@ class Repository:
                     leads.append(Lead.model_validate_json(record.full_data))
             return leads
 
+    def _verified_leads_query(
+        self,
+        session: Session,
+        entities: tuple,
+        social_verified: Optional[bool],
+        high_intent: Optional[bool],
+    ):
+        """Build the filtered, score-ordered query behind the verified lead listings."""
+        query = session.query(*entities).filter(
+            LeadRecord.verification_status == "verified",
+        )
+
+        if social_verified is not None:
+            query = query.filter(LeadRecord.social_verified == social_verified)
+        if high_intent is not None:
+            query = query.filter(LeadRecord.high_intent == high_intent)
+
+        return query.order_by(LeadRecord.lead_score.desc())
+
     def get_verified_leads(
         self,
         social_verified: Optional[bool] = None,
@@ -414,23 +479,41 @@ class Repository:
     ) -> list[Lead]:
         """Get verified leads with optional filters."""
         with self.get_session() as session:
-            query = session.query(LeadRecord).filter(
-                LeadRecord.verification_status == "verified",
-            )
-
-            if social_verified is not None:
-                query = query.filter(LeadRecord.social_verified == social_verified)
-            if high_intent is not None:
-                query = query.filter(LeadRecord.high_intent == high_intent)
-
-            query = query.order_by(LeadRecord.lead_score.desc()).limit(limit)
+            query = self._verified_leads_query(
+                session, (LeadRecord,), social_verified, high_intent
+            ).limit(limit)
 
+            # Stream rows in batches so each record can be released once rehydrated
             leads = []
-            for record in query.all():
+            for record in query.yield_per(100):
                 if record.full_data:
                     leads.append(Lead.model_validate_json(record.full_data))
             return leads
 
+    def get_verified_lead_rows(
+        self,
+        social_verified: Optional[bool] = None,
+        high_intent: Optional[bool] = None,
+        limit: int = 50,
+    ) -> list[dict]:
+        """
+        Get listing fields of verified leads without rehydrating Lead.
+
+        Same filters and order as get_verified_leads, but reads only the
+        columns an API listing needs instead of parsing full_data per row.
+        """
+        with self.get_session() as session:
+            query = self._verified_leads_query(
+                session, _VERIFIED_LISTING_COLUMNS, social_verified, high_intent
+            ).filter(LeadRecord.full_data.isnot(None)).limit(limit)
+
+            rows = []
+            for row in query:
+                data = row._asdict()
+                data["equipment_types"] = _equipment_values(data["equipment_types"])
+                rows.append(data)
+            return rows
+
     def get_verification_stats(self) -> dict:
         """Get verification statistics."""
         with self.get_session() as session:
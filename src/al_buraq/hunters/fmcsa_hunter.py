@@ -6,21 +6,141 @@ This is a primary source for new owner-operator leads.
 """
 
 import asyncio
+import logging
+import random
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, AsyncIterator
+from typing import Any, Awaitable, Callable, Iterator, Optional, AsyncIterator
 from dataclasses import dataclass
 
 import httpx
-from bs4 import BeautifulSoup
+import numpy as np
 
 from .base_hunter import BaseHunter, HuntResult
-from ..models.lead import Lead, ContactInfo, AuthorityInfo, InsuranceInfo, FleetInfo
+from ..models.lead import Lead
 from ..models.enums import LeadSource, EquipmentType
 from ..config import settings
 
+logger = logging.getLogger(__name__)
+
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# Common US state abbreviations
+STATES = (
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+)
+
+# A state abbreviation preceded by a space and followed by a space or the end
+_STATE_RE = re.compile(r"(?<= )(" + "|".join(STATES) + r")(?= |$)")
+
+EASTERN_STATES = (
+    "CT", "DE", "FL", "GA", "IN", "KY", "ME", "MD", "MA", "MI",
+    "NH", "NJ", "NY", "NC", "OH", "PA", "RI", "SC", "TN", "VT",
+    "VA", "WV",
+)
+CENTRAL_STATES = (
+    "AL", "AR", "IL", "IA", "KS", "LA", "MN", "MS", "MO", "NE",
+    "ND", "OK", "SD", "TX", "WI",
+)
+MOUNTAIN_STATES = ("AZ", "CO", "ID", "MT", "NM", "UT", "WY")
+PACIFIC_STATES = ("CA", "NV", "OR", "WA")
+
+_STATE_TZ: dict[str, str] = (
+    {s: "America/New_York" for s in EASTERN_STATES}
+    | {s: "America/Chicago" for s in CENTRAL_STATES}
+    | {s: "America/Denver" for s in MOUNTAIN_STATES}
+    | {s: "America/Los_Angeles" for s in PACIFIC_STATES}
+)
+
+# Cargo keywords that imply an equipment type, scanned in a single pass
+_CARGO_EQUIPMENT = {
+    "refrigerated": EquipmentType.REEFER,
+    "fresh": EquipmentType.REEFER,
+    "frozen": EquipmentType.REEFER,
+    "produce": EquipmentType.REEFER,
+    "machinery": EquipmentType.FLATBED,
+    "building materials": EquipmentType.FLATBED,
+    "lumber": EquipmentType.FLATBED,
+    "steel": EquipmentType.FLATBED,
+    "liquid": EquipmentType.TANKER,
+    "petroleum": EquipmentType.TANKER,
+    "chemicals": EquipmentType.TANKER,
+    "general freight": EquipmentType.DRY_VAN,
+}
+_CARGO_RE = re.compile("|".join(map(re.escape, _CARGO_EQUIPMENT)))
+_EQUIPMENT_ORDER = (
+    EquipmentType.REEFER,
+    EquipmentType.FLATBED,
+    EquipmentType.TANKER,
+    EquipmentType.DRY_VAN,
+)
+# Pools for simulated SAFER data (see FMCSAHunter._generate_test_carriers)
+_TEST_STATES = ("TX", "CA", "FL", "IL", "GA", "OH", "PA", "NC", "TN", "AZ")
+_TEST_CITIES: dict[str, tuple[str, ...]] = {
+    "TX": ("Houston", "Dallas", "San Antonio", "Austin"),
+    "CA": ("Los Angeles", "San Francisco", "San Diego", "Fresno"),
+    "FL": ("Miami", "Orlando", "Tampa", "Jacksonville"),
+    "IL": ("Chicago", "Springfield", "Rockford"),
+    "GA": ("Atlanta", "Savannah", "Augusta"),
+    "OH": ("Columbus", "Cleveland", "Cincinnati"),
+    "PA": ("Philadelphia", "Pittsburgh", "Harrisburg"),
+    "NC": ("Charlotte", "Raleigh", "Greensboro"),
+    "TN": ("Nashville", "Memphis", "Knoxville"),
+    "AZ": ("Phoenix", "Tucson", "Mesa"),
+}
+_AREA_CODES: dict[str, tuple[str, ...]] = {
+    "TX": ("214", "512", "713", "832"),
+    "CA": ("213", "310", "415", "619"),
+    "FL": ("305", "407", "813", "954"),
+}
+_COMPANY_PREFIXES = (
+    "Swift", "Eagle", "Freedom", "Liberty", "Star", "American",
+    "National", "United", "Express", "Direct", "First", "Prime",
+    "Elite", "Alpha", "Apex", "Atlas", "Blue", "Red", "Golden",
+)
+_COMPANY_SUFFIXES = (
+    "Trucking", "Transport", "Logistics", "Freight", "Hauling",
+    "Transportation", "Carriers", "Lines", "Express", "Services",
+)
+_CARGO_TYPES = (
+    ("General Freight",),
+    ("General Freight", "Household Goods"),
+    ("Refrigerated Food", "Fresh Produce"),
+    ("Building Materials", "Lumber"),
+    ("Machinery", "Large Objects"),
+    ("General Freight", "Paper Products"),
+)
+
+
+class _RateLimiter:
+    """
+    Space out request starts by a fixed interval.
+
+    Unlike sleeping after each request, the work done between two
+    acquisitions overlaps with the wait instead of adding to it.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_slot > now:
+                await asyncio.sleep(self._next_slot - now)
+                now = self._next_slot
+            self._next_slot = now + self.interval
+
 
-@dataclass
+@dataclass(slots=True)
 class SAFERCarrierData:
     """Raw carrier data from SAFER."""
 
@@ -59,6 +179,14 @@ class FMCSAHunter(BaseHunter):
     def __init__(self):
         super().__init__(source_name="FMCSA_SAFER")
         self.rate_limit_delay = settings.HUNTER_RATE_LIMIT_DELAY
+        self._limiter = _RateLimiter(self.rate_limit_delay)
+        # Bounds conversions only; SAFER requests made inside a conversion
+        # must not take a slot here, or a full set of conversions would
+        # wait on each other forever
+        self._convert_slots = asyncio.Semaphore(settings.HUNTER_MAX_CONCURRENCY)
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        # MC number -> (expires_at, authority status), least recently used first
+        self._authority_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
 
     async def hunt(
         self,
@@ -81,19 +209,37 @@ class FMCSAHunter(BaseHunter):
             HuntResult with discovered leads
         """
         result = HuntResult(source=self.source_name)
+        now = datetime.utcnow()
+
+        # Launch every conversion at once; _convert_slots bounds how many
+        # run concurrently and the rate limiter spaces out their starts
+        tasks = [
+            asyncio.create_task(self._carrier_to_lead_limited(carrier_data, now))
+            for carrier_data in self._generate_test_carriers(limit, states, now=now)
+            if self._within_age(
+                carrier_data, now, min_authority_age_days, max_authority_age_days
+            )
+        ]
 
         leads = []
-        async for lead in self.hunt_stream(
-            limit=limit,
-            min_authority_age_days=min_authority_age_days,
-            max_authority_age_days=max_authority_age_days,
-            states=states,
-        ):
-            leads.append(lead)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    lead = await next_done
+                except Exception as e:
+                    result.errors.append(str(e))
+                    continue
+                if lead:
+                    leads.append(lead)
+                    if len(leads) >= limit:
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
 
         result.leads = leads
         result.total_found = len(leads)
-        result.total_processed = len(leads)
+        result.total_processed = len(tasks)
 
         return result.complete()
 
@@ -114,18 +260,20 @@ class FMCSAHunter(BaseHunter):
         # For MVP, generate simulated leads
         # TODO: Replace with actual FMCSA API integration
         count = 0
+        now = datetime.utcnow()
 
-        for carrier_data in self._generate_test_carriers(limit, states):
+        for carrier_data in self._generate_test_carriers(limit, states, now=now):
             try:
-                # Apply age filter
-                if carrier_data.mcs150_date:
-                    age_days = (datetime.utcnow() - carrier_data.mcs150_date).days
-                    if age_days < min_authority_age_days:
-                        continue
-                    if age_days > max_authority_age_days:
-                        continue
-
-                lead = await self._carrier_to_lead(carrier_data)
+                if not self._within_age(
+                    carrier_data, now, min_authority_age_days, max_authority_age_days
+                ):
+                    continue
+
+                # Rate limiting: space out fetches without also stalling
+                # on the consumer's work between yields
+                await self._limiter.acquire()
+
+                lead = await self._carrier_to_lead(carrier_data, now=now)
                 if lead:
                     count += 1
                     yield lead
@@ -133,14 +281,49 @@ class FMCSAHunter(BaseHunter):
                     if count >= limit:
                         break
 
-                # Rate limiting
-                await asyncio.sleep(self.rate_limit_delay)
-
-            except Exception as e:
+            except Exception:
                 # Log error but continue
-                print(f"Error processing carrier {carrier_data.mc_number}: {e}")
+                logger.exception("Error processing carrier %s", carrier_data.mc_number)
                 continue
 
+    @staticmethod
+    def _within_age(
+        carrier_data: SAFERCarrierData,
+        now: datetime,
+        min_authority_age_days: int,
+        max_authority_age_days: int,
+    ) -> bool:
+        """Apply the authority age filter (carriers without a date pass)."""
+        if not carrier_data.mcs150_date:
+            return True
+        age_days = (now - carrier_data.mcs150_date).days
+        return min_authority_age_days <= age_days <= max_authority_age_days
+
+    async def _carrier_to_lead_limited(
+        self,
+        data: SAFERCarrierData,
+        now: datetime,
+    ) -> Optional[Lead]:
+        """Convert one carrier under the concurrency and rate limits."""
+        async with self._convert_slots:
+            await self._limiter.acquire()
+            return await self._carrier_to_lead(data, now=now)
+
+    async def _single_flight(self, key: tuple, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Coalesce concurrent calls for the same key into one request.
+
+        Callers that arrive while a request for ``key`` is in flight await
+        the same task instead of issuing a duplicate SAFER query.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
     async def lookup_carrier(self, mc_number: str) -> Optional[Lead]:
         """
         Look up a specific carrier by MC number.
@@ -151,6 +334,11 @@ class FMCSAHunter(BaseHunter):
         Returns:
             Lead if found, None otherwise
         """
+        return await self._single_flight(
+            ("lookup", mc_number), lambda: self._lookup_carrier(mc_number)
+        )
+
+    async def _lookup_carrier(self, mc_number: str) -> Optional[Lead]:
         # In production, this would query SAFER directly
         # For now, return None (not found)
         return None
@@ -165,6 +353,30 @@ class FMCSAHunter(BaseHunter):
         Returns:
             Dict with authority status details
         """
+        cache = self._authority_cache
+        cached = cache.get(mc_number)
+        if cached is not None:
+            expires_at, status = cached
+            if expires_at > time.monotonic():
+                cache.move_to_end(mc_number)
+                return dict(status)
+            del cache[mc_number]
+
+        status = await self._single_flight(
+            ("verify", mc_number), lambda: self._verify_authority(mc_number)
+        )
+
+        cache[mc_number] = (time.monotonic() + settings.HUNTER_AUTHORITY_CACHE_TTL, status)
+        cache.move_to_end(mc_number)
+        while len(cache) > settings.HUNTER_AUTHORITY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return dict(status)
+
+    def clear_authority_cache(self) -> None:
+        """Forget cached authority checks so the next verify hits SAFER."""
+        self._authority_cache.clear()
+
+    async def _verify_authority(self, mc_number: str) -> dict:
         # In production, check SAFER for current status
         return {
             "mc_number": mc_number,
@@ -175,9 +387,15 @@ class FMCSAHunter(BaseHunter):
             "broker_authority": False,
         }
 
-    async def _carrier_to_lead(self, data: SAFERCarrierData) -> Optional[Lead]:
+    async def _carrier_to_lead(
+        self,
+        data: SAFERCarrierData,
+        now: Optional[datetime] = None,
+    ) -> Optional[Lead]:
         """Convert SAFER data to a Lead object."""
         try:
+            now = now or datetime.utcnow()
+
             # Parse phone number
             phone = self._clean_phone(data.phone) if data.phone else None
             if not phone:
@@ -190,28 +408,32 @@ class FMCSAHunter(BaseHunter):
             equipment = self._infer_equipment(data.cargo_carried, data.carrier_operation)
 
             # Calculate authority date
-            authority_date = data.mcs150_date or datetime.utcnow() - timedelta(days=30)
+            authority_date = data.mcs150_date or now - timedelta(days=30)
 
+            # Nested sections are passed as dicts and validated by the single
+            # Lead(...) call; building each sub-model separately costs an extra
+            # Python-level __init__ apiece. Lead.model_construct is not used:
+            # on pydantic 2.x it resolves defaults in Python and is far slower.
             lead = Lead(
                 company_name=data.legal_name,
                 dba_name=data.dba_name,
                 legal_name=data.legal_name,
-                contact=ContactInfo(
+                contact=dict(
                     phone_primary=phone,
                     timezone=self._state_to_timezone(state),
                 ),
-                authority=AuthorityInfo(
+                authority=dict(
                     mc_number=data.mc_number,
                     dot_number=data.dot_number,
                     authority_status="ACTIVE",
                     authority_granted_date=authority_date,
                     common_authority=True,
                 ),
-                insurance=InsuranceInfo(
+                insurance=dict(
                     liability_coverage=1_000_000,  # Assumed minimum for active authority
                     cargo_coverage=100_000,
                 ),
-                fleet=FleetInfo(
+                fleet=dict(
                     truck_count=data.power_units,
                     driver_count=data.drivers,
                     equipment_types=equipment,
@@ -219,20 +441,22 @@ class FMCSAHunter(BaseHunter):
                     operating_states=[state] if state else [],
                 ),
                 source=LeadSource.FMCSA_SAFER,
-                scraped_at=datetime.utcnow(),
+                scraped_at=now,
+                created_at=now,
+                updated_at=now,
             )
 
             return lead
 
-        except Exception as e:
-            print(f"Error converting carrier to lead: {e}")
+        except Exception:
+            logger.exception("Error converting carrier %s to lead", data.mc_number)
             return None
 
     def _clean_phone(self, phone: str) -> Optional[str]:
         """Clean and validate phone number."""
         if not phone:
             return None
-        digits = re.sub(r"\D", "", phone)
+        digits = phone if phone.isdecimal() else _NON_DIGIT_RE.sub("", phone)
         if len(digits) == 10:
             return f"+1{digits}"
         elif len(digits) == 11 and digits.startswith("1"):
@@ -244,41 +468,12 @@ class FMCSAHunter(BaseHunter):
         if not address:
             return None
 
-        # Common US state abbreviations
-        states = [
-            "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
-            "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
-            "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
-            "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
-            "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
-        ]
-
-        # Look for state abbreviation
-        for state in states:
-            if f" {state} " in address or address.endswith(f" {state}"):
-                return state
-
-        return None
+        match = _STATE_RE.search(address)
+        return match.group(1) if match else None
 
     def _state_to_timezone(self, state: Optional[str]) -> str:
         """Map state to timezone."""
-        eastern = ["CT", "DE", "FL", "GA", "IN", "KY", "ME", "MD", "MA", "MI",
-                   "NH", "NJ", "NY", "NC", "OH", "PA", "RI", "SC", "TN", "VT",
-                   "VA", "WV"]
-        central = ["AL", "AR", "IL", "IA", "KS", "LA", "MN", "MS", "MO", "NE",
-                   "ND", "OK", "SD", "TX", "WI"]
-        mountain = ["AZ", "CO", "ID", "MT", "NM", "UT", "WY"]
-        pacific = ["CA", "NV", "OR", "WA"]
-
-        if state in eastern:
-            return "America/New_York"
-        elif state in central:
-            return "America/Chicago"
-        elif state in mountain:
-            return "America/Denver"
-        elif state in pacific:
-            return "America/Los_Angeles"
-        return "America/Chicago"  # Default
+        return _STATE_TZ.get(state, "America/Chicago")  # Default: Central
 
     def _infer_equipment(
         self,
@@ -286,112 +481,72 @@ class FMCSAHunter(BaseHunter):
         operation: Optional[str],
     ) -> list[EquipmentType]:
         """Infer equipment types from cargo and operation."""
-        equipment = []
-
         cargo_lower = " ".join(cargo).lower() if cargo else ""
-        operation_lower = (operation or "").lower()
-
-        # Refrigerated
-        if any(x in cargo_lower for x in ["refrigerated", "fresh", "frozen", "produce"]):
-            equipment.append(EquipmentType.REEFER)
 
-        # Flatbed
-        if any(x in cargo_lower for x in ["machinery", "building materials", "lumber", "steel"]):
-            equipment.append(EquipmentType.FLATBED)
-
-        # Tanker
-        if any(x in cargo_lower for x in ["liquid", "petroleum", "chemicals"]):
-            equipment.append(EquipmentType.TANKER)
-
-        # Default to dry van for general freight
-        if not equipment or "general freight" in cargo_lower:
-            equipment.append(EquipmentType.DRY_VAN)
-
-        return equipment
+        found = {_CARGO_EQUIPMENT[m] for m in _CARGO_RE.findall(cargo_lower)}
+        # Default to dry van when no cargo keyword matched
+        return [e for e in _EQUIPMENT_ORDER if e in found] or [EquipmentType.DRY_VAN]
 
     def _generate_test_carriers(
         self,
         count: int,
         states: Optional[list[str]] = None,
-    ) -> list[SAFERCarrierData]:
+        now: Optional[datetime] = None,
+    ) -> Iterator[SAFERCarrierData]:
         """
         Generate realistic test carrier data for development.
 
+        Carriers are yielded one at a time so callers can convert and
+        stream each one before the next is built.
+
         In production, this would be replaced with actual API calls.
         """
-        import random
-
-        test_states = states or ["TX", "CA", "FL", "IL", "GA", "OH", "PA", "NC", "TN", "AZ"]
-        test_cities = {
-            "TX": ["Houston", "Dallas", "San Antonio", "Austin"],
-            "CA": ["Los Angeles", "San Francisco", "San Diego", "Fresno"],
-            "FL": ["Miami", "Orlando", "Tampa", "Jacksonville"],
-            "IL": ["Chicago", "Springfield", "Rockford"],
-            "GA": ["Atlanta", "Savannah", "Augusta"],
-            "OH": ["Columbus", "Cleveland", "Cincinnati"],
-            "PA": ["Philadelphia", "Pittsburgh", "Harrisburg"],
-            "NC": ["Charlotte", "Raleigh", "Greensboro"],
-            "TN": ["Nashville", "Memphis", "Knoxville"],
-            "AZ": ["Phoenix", "Tucson", "Mesa"],
-        }
-
-        company_prefixes = [
-            "Swift", "Eagle", "Freedom", "Liberty", "Star", "American",
-            "National", "United", "Express", "Direct", "First", "Prime",
-            "Elite", "Alpha", "Apex", "Atlas", "Blue", "Red", "Golden",
-        ]
-        company_suffixes = [
-            "Trucking", "Transport", "Logistics", "Freight", "Hauling",
-            "Transportation", "Carriers", "Lines", "Express", "Services",
-        ]
-
-        cargo_types = [
-            ["General Freight"],
-            ["General Freight", "Household Goods"],
-            ["Refrigerated Food", "Fresh Produce"],
-            ["Building Materials", "Lumber"],
-            ["Machinery", "Large Objects"],
-            ["General Freight", "Paper Products"],
-        ]
-
-        carriers = []
-
-        for i in range(count):
-            state = random.choice(test_states)
-            city = random.choice(test_cities.get(state, ["City"]))
-
-            # Generate MC/DOT numbers (realistic ranges)
-            mc = str(random.randint(1000000, 1500000))
-            dot = str(random.randint(3000000, 4000000))
-
-            # Random authority age (0-180 days for new authorities)
-            age_days = random.randint(0, 180)
-            authority_date = datetime.utcnow() - timedelta(days=age_days)
+        test_states = states or _TEST_STATES
+        now = now or datetime.utcnow()
+
+        # Draw the numeric fields for the whole batch up front
+        rng = np.random.default_rng()
+        # MC/DOT numbers (realistic ranges)
+        mcs = rng.integers(1_000_000, 1_500_001, size=count).tolist()
+        dots = rng.integers(3_000_000, 4_000_001, size=count).tolist()
+        # Authority age (0-180 days for new authorities)
+        ages = rng.integers(0, 181, size=count).tolist()
+        power_units = rng.choice(
+            [1, 2, 3, 5, 10], size=count, p=[0.50, 0.25, 0.15, 0.07, 0.03]
+        ).tolist()
+        drivers = rng.integers(1, 6, size=count).tolist()
+        # 7-digit phone tails, formatted as strings in one pass
+        phone_tails = rng.integers(1_000_000, 10_000_000, size=count).astype("U7").tolist()
+
+        # Categorical draws for the whole batch, made in C by random.choices
+        batch_states = random.choices(test_states, k=count)
+        prefixes = random.choices(_COMPANY_PREFIXES, k=count)
+        suffixes = random.choices(_COMPANY_SUFFIXES, k=count)
+        cargo_types = random.choices(_CARGO_TYPES, k=count)
+
+        for i, state in enumerate(batch_states):
+            city = random.choice(_TEST_CITIES.get(state, ("City",)))
+
+            mc = str(mcs[i])
+            dot = str(dots[i])
+
+            authority_date = now - timedelta(days=ages[i])
 
             # Generate company name
-            company = f"{random.choice(company_prefixes)} {random.choice(company_suffixes)} LLC"
+            company = f"{prefixes[i]} {suffixes[i]} LLC"
 
             # Generate phone
-            area_codes = {
-                "TX": ["214", "512", "713", "832"],
-                "CA": ["213", "310", "415", "619"],
-                "FL": ["305", "407", "813", "954"],
-            }
-            area = random.choice(area_codes.get(state, ["555"]))
-            phone = f"{area}{random.randint(1000000, 9999999)}"
-
-            carriers.append(
-                SAFERCarrierData(
-                    mc_number=mc,
-                    dot_number=dot,
-                    legal_name=company,
-                    physical_address=f"{city}, {state}",
-                    phone=phone,
-                    power_units=random.choices([1, 2, 3, 5, 10], weights=[50, 25, 15, 7, 3])[0],
-                    drivers=random.randint(1, 5),
-                    mcs150_date=authority_date,
-                    cargo_carried=random.choice(cargo_types),
-                )
+            area = random.choice(_AREA_CODES.get(state, ("555",)))
+            phone = area + phone_tails[i]
+
+            yield SAFERCarrierData(
+                mc_number=mc,
+                dot_number=dot,
+                legal_name=company,
+                physical_address=f"{city}, {state}",
+                phone=phone,
+                power_units=power_units[i],
+                drivers=drivers[i],
+                mcs150_date=authority_date,
+                cargo_carried=list(cargo_types[i]),
             )
-
-        return carriers
@@ -277,9 +277,11 @@ class Carrier(BaseModel):
 
     def add_note(self, note: str) -> None:
         """Add an internal note."""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M")
+        now = datetime.utcnow()
+        # Same "YYYY-MM-DD HH:MM" text as strftime, without the libc round-trip
+        timestamp = now.isoformat(sep=" ", timespec="minutes")
         self.internal_notes.append(f"[{timestamp}] {note}")
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
 
     @classmethod
     def from_lead(cls, lead: "Lead", agreement: DispatcherAgreement) -> "Carrier":
@@ -304,14 +306,13 @@ class Carrier(BaseModel):
 
     def to_embedding_text(self) -> str:
         """Generate text for vector embedding."""
-        parts = [
-            f"Carrier: {self.company_name}",
-            f"MC: {self.authority.mc_number}",
-            f"Trucks: {self.fleet.truck_count}",
-            f"Equipment: {', '.join(str(e) for e in self.fleet.equipment_types)}",
-            f"Location: {self.current_location_city or 'Unknown'}, {self.current_location_state or 'Unknown'}",
-            f"Preferred lanes: {', '.join(self.fleet.preferred_lanes)}",
-            f"Min rate: ${self.preferences.min_rate_per_mile}/mi",
-            f"Reliability: {self.performance.reliability_score:.0%}",
-        ]
-        return " | ".join(parts)
+        return (
+            f"Carrier: {self.company_name}"
+            f" | MC: {self.authority.mc_number}"
+            f" | Trucks: {self.fleet.truck_count}"
+            f" | Equipment: {', '.join(str(e) for e in self.fleet.equipment_types)}"
+            f" | Location: {self.current_location_city or 'Unknown'}, {self.current_location_state or 'Unknown'}"
+            f" | Preferred lanes: {', '.join(self.fleet.preferred_lanes)}"
+            f" | Min rate: ${self.preferences.min_rate_per_mile}/mi"
+            f" | Reliability: {self.performance.reliability_score:.0%}"
+        )
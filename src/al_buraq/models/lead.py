@@ -1,14 +1,32 @@
 """Lead model for potential carrier partners."""
 
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 import re
+import sys
 import uuid
 
 from pydantic import BaseModel, Field, field_validator, computed_field
 
 from .enums import EquipmentType, LeadStatus, LeadSource
 
+_NON_DIGIT_RE = re.compile(r"\D")
+# Deletes every Latin-1 character except the ASCII digits
+_DIGITS_ONLY = str.maketrans("", "", "".join(c for c in map(chr, range(256)) if c not in "0123456789"))
+_EMAIL_RE = re.compile(r"^[\w\.\-\+]+@[\w\.\-]+\.\w+$")
+
+
+def _clean_number(value: object) -> str:
+    """Keep only the digits of an MC/DOT number ("MC-123456" -> "123456")."""
+    s = str(value).strip()
+    if s.isdecimal():
+        return s
+    # Common case: a short label prefix such as "MC", "DOT" or "#"
+    stripped = s.lstrip("MCDOTmcdot#- ")
+    if stripped.isdecimal():
+        return stripped
+    return _NON_DIGIT_RE.sub("", s)
+
 
 class ContactInfo(BaseModel):
     """Contact information for a lead."""
@@ -27,8 +45,16 @@ class ContactInfo(BaseModel):
     def validate_phone(cls, v: Optional[str]) -> Optional[str]:
         if v is None or v == "":
             return None
-        # Strip non-digits
-        digits = re.sub(r"\D", "", str(v))
+        s = str(v)
+        # Fast path for bare 10-digit and already-normalized +1 numbers
+        if len(s) == 10 and s.isascii() and s.isdecimal():
+            return f"+1{s}"
+        if len(s) == 12 and s.startswith("+1") and s.isascii() and s[1:].isdecimal():
+            return s
+        # Strip non-digits; the regex only runs for input beyond Latin-1
+        digits = s.translate(_DIGITS_ONLY)
+        if not digits.isascii():
+            digits = _NON_DIGIT_RE.sub("", digits)
         if len(digits) == 10:
             return f"+1{digits}"
         elif len(digits) == 11 and digits.startswith("1"):
@@ -43,7 +69,7 @@ class ContactInfo(BaseModel):
         if v is None or v == "":
             return None
         v = str(v).strip()
-        if not re.match(r"^[\w\.\-\+]+@[\w\.\-]+\.\w+$", v):
+        if not _EMAIL_RE.match(v):
             raise ValueError(f"Invalid email: {v}")
         return v.lower()
 
@@ -68,7 +94,6 @@ class AuthorityInfo(BaseModel):
         delta = datetime.utcnow() - self.authority_granted_date
         return max(0, delta.days)
 
-    @computed_field
     @property
     def is_new_authority(self) -> bool:
         """Authority less than 90 days old."""
@@ -80,7 +105,7 @@ class AuthorityInfo(BaseModel):
         if v is None:
             raise ValueError("MC number is required")
         # Remove 'MC' prefix if present, ensure numeric
-        clean = re.sub(r"[^\d]", "", str(v))
+        clean = _clean_number(v)
         if not clean:
             raise ValueError(f"Invalid MC number: {v}")
         return clean
@@ -90,7 +115,7 @@ class AuthorityInfo(BaseModel):
     def validate_dot(cls, v: str) -> str:
         if v is None:
             raise ValueError("DOT number is required")
-        clean = re.sub(r"[^\d]", "", str(v))
+        clean = _clean_number(v)
         if not clean:
             raise ValueError(f"Invalid DOT number: {v}")
         return clean
@@ -108,10 +133,9 @@ class InsuranceInfo(BaseModel):
     verification_date: Optional[datetime] = None
 
     # Minimum requirements (from MISSION.md)
-    MIN_LIABILITY: int = 1_000_000
-    MIN_CARGO: int = 100_000
+    MIN_LIABILITY: ClassVar[int] = 1_000_000
+    MIN_CARGO: ClassVar[int] = 100_000
 
-    @computed_field
     @property
     def meets_minimum_requirements(self) -> bool:
         """Check if insurance meets our minimum requirements."""
@@ -120,7 +144,6 @@ class InsuranceInfo(BaseModel):
             and self.cargo_coverage >= self.MIN_CARGO
         )
 
-    @computed_field
     @property
     def is_expired(self) -> bool:
         """Check if insurance is expired."""
@@ -146,15 +169,26 @@ class FleetInfo(BaseModel):
     def validate_states(cls, v: list) -> list[str]:
         if v is None:
             return []
+        # State codes are interned so every lead shares one object per state
+        # Already canonical (e.g. rehydrated from our own store): skip normalizing
+        if all(type(s) is str and len(s) == 2 and s.isupper() for s in v):
+            return list(map(sys.intern, v))
         # Convert to uppercase 2-letter codes
-        return [s.upper()[:2] for s in v if s]
+        return [sys.intern(s.upper()[:2]) for s in v if s]
 
     @field_validator("home_base_state", mode="before")
     @classmethod
     def validate_home_state(cls, v: Optional[str]) -> Optional[str]:
         if v is None or v == "":
             return None
-        return v.upper()[:2]
+        if len(v) == 2 and v.isupper():
+            return sys.intern(v)
+        return sys.intern(v.upper()[:2])
+
+    class Config:
+        # Store equipment as plain values ("dry_van"), so str(), joins and
+        # set lookups all see the value rather than "EquipmentType.DRY_VAN"
+        use_enum_values = True
 
 
 class SafetyInfo(BaseModel):
@@ -197,7 +231,6 @@ class SafetyInfo(BaseModel):
             return None
         return sum(valid_scores) / len(valid_scores)
 
-    @computed_field
     @property
     def safety_rating(self) -> str:
         """Return safety rating category."""
@@ -280,16 +313,19 @@ class Lead(BaseModel):
 
     def add_note(self, note: str) -> None:
         """Add a timestamped note."""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M")
+        now = datetime.utcnow()
+        # Same "YYYY-MM-DD HH:MM" text as strftime, without the libc round-trip
+        timestamp = now.isoformat(sep=" ", timespec="minutes")
         self.notes.append(f"[{timestamp}] {note}")
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
 
     def mark_contacted(self, outcome: str) -> None:
         """Record a contact attempt."""
+        now = datetime.utcnow()
         self.contact_attempts += 1
-        self.last_contact_date = datetime.utcnow()
+        self.last_contact_date = now
         self.last_contact_outcome = outcome
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
         if self.status == LeadStatus.NEW:
             self.status = LeadStatus.CONTACTED
 
@@ -299,8 +335,9 @@ class Lead(BaseModel):
         self.score_breakdown = breakdown
         self.is_qualified = True
         self.status = LeadStatus.QUALIFIED
-        self.qualified_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.qualified_at = now
+        self.updated_at = now
 
     def disqualify(self, reason: str) -> None:
         """Mark lead as disqualified."""
@@ -311,26 +348,29 @@ class Lead(BaseModel):
 
     def to_embedding_text(self) -> str:
         """Generate text representation for vector embedding."""
-        parts = [
-            f"Company: {self.company_name}",
-            f"MC: {self.authority.mc_number}",
-            f"DOT: {self.authority.dot_number}",
-            f"Trucks: {self.fleet.truck_count}",
-            f"Equipment: {', '.join(str(e) for e in self.fleet.equipment_types)}",
-            f"States: {', '.join(self.fleet.operating_states)}",
-            f"Lanes: {', '.join(self.fleet.preferred_lanes)}",
-        ]
-        if self.fleet.home_base_state:
-            parts.append(f"Based in: {self.fleet.home_base_city or ''}, {self.fleet.home_base_state}")
-        return " | ".join(parts)
+        fleet = self.fleet
+        home = (
+            f" | Based in: {fleet.home_base_city or ''}, {fleet.home_base_state}"
+            if fleet.home_base_state
+            else ""
+        )
+        return (
+            f"Company: {self.company_name}"
+            f" | MC: {self.authority.mc_number}"
+            f" | DOT: {self.authority.dot_number}"
+            f" | Trucks: {fleet.truck_count}"
+            f" | Equipment: {', '.join(str(e) for e in fleet.equipment_types)}"
+            f" | States: {', '.join(fleet.operating_states)}"
+            f" | Lanes: {', '.join(fleet.preferred_lanes)}"
+            f"{home}"
+        )
 
     def to_search_dict(self) -> dict:
         """Convert to dictionary for search/filter operations (ChromaDB compatible)."""
-        # ChromaDB metadata only accepts str, int, float, bool - convert lists to strings
-        equipment_str = ",".join(
-            e.value if hasattr(e, 'value') else str(e)
-            for e in self.fleet.equipment_types
-        )
+        # ChromaDB metadata only accepts str, int, float, bool - convert lists to strings.
+        # Equipment entries are plain values (see FleetInfo.Config), or members
+        # assigned later; both are str instances holding the value.
+        equipment_str = ",".join(self.fleet.equipment_types)
         states_str = ",".join(self.fleet.operating_states)
 
         return {
@@ -343,8 +383,11 @@ class Lead(BaseModel):
             "operating_states": states_str,
             "home_base_state": self.fleet.home_base_state or "",
             "lead_score": self.lead_score,
-            "status": str(self.status),
-            "source": str(self.source),
+            # Validated input is stored as the plain value; defaults and later
+            # assignments (e.g. mark_contacted) keep the member, a str subclass
+            # holding the same value
+            "status": self.status,
+            "source": self.source,
             "is_qualified": self.is_qualified,
             "authority_age_days": self.authority.authority_age_days,
             "meets_insurance": self.insurance.meets_minimum_requirements,
@@ -26,7 +26,6 @@ class Location(BaseModel):
     def __str__(self) -> str:
         return f"{self.city}, {self.state}"
 
-    @computed_field
     @property
     def full_address(self) -> str:
         """Return full address string."""
@@ -48,14 +47,12 @@ class TimeWindow(BaseModel):
     appointment_time: Optional[datetime] = None
     fcfs: bool = False  # First Come First Serve
 
-    @computed_field
     @property
     def window_hours(self) -> float:
         """Hours between earliest and latest."""
         delta = self.latest - self.earliest
         return delta.total_seconds() / 3600
 
-    @computed_field
     @property
     def is_tight_window(self) -> bool:
         """Window less than 2 hours."""
@@ -82,13 +79,11 @@ class LoadDimensions(BaseModel):
     temperature_min: Optional[float] = None  # Fahrenheit
     temperature_max: Optional[float] = None
 
-    @computed_field
     @property
     def is_heavy(self) -> bool:
         """Load over 40,000 lbs."""
         return self.weight_lbs > 40_000
 
-    @computed_field
     @property
     def is_oversized(self) -> bool:
         """Load exceeds standard dimensions."""
@@ -123,7 +118,6 @@ class BrokerInfo(BaseModel):
     reliability_score: float = 1.0  # 0-1
     notes: list[str] = Field(default_factory=list)
 
-    @computed_field
     @property
     def is_trusted(self) -> bool:
         """Broker has good payment history."""
@@ -252,13 +246,11 @@ class Load(BaseModel):
         """Generate lane string (e.g., 'TX-CA')."""
         return f"{self.origin.state}-{self.destination.state}"
 
-    @computed_field
     @property
     def is_good_rate(self) -> bool:
         """Rate meets our minimum threshold ($2.00/mi)."""
         return self.rate_per_mile >= 2.00
 
-    @computed_field
     @property
     def is_excellent_rate(self) -> bool:
         """Rate exceeds our target ($2.75/mi)."""
@@ -272,7 +264,6 @@ class Load(BaseModel):
             return 0.0
         return round(self.deadhead_miles / self.loaded_miles, 2)
 
-    @computed_field
     @property
     def is_low_deadhead(self) -> bool:
         """Deadhead less than 15% of loaded miles."""
@@ -289,8 +280,9 @@ class Load(BaseModel):
         self.status = LoadStatus.BOOKED
         self.assigned_carrier_id = carrier_id
         self.assigned_carrier_name = carrier_name
-        self.booked_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.booked_at = now
+        self.updated_at = now
         self.calculate_commission()
 
     def dispatch(self, driver_name: str, driver_phone: str) -> None:
@@ -298,21 +290,24 @@ class Load(BaseModel):
         self.status = LoadStatus.DISPATCHED
         self.assigned_driver_name = driver_name
         self.assigned_driver_phone = driver_phone
-        self.dispatched_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.dispatched_at = now
+        self.updated_at = now
 
     def mark_picked_up(self) -> None:
         """Mark load as picked up."""
         self.status = LoadStatus.IN_TRANSIT
-        self.picked_up_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.picked_up_at = now
+        self.updated_at = now
         self.add_tracking_update("Picked up at origin")
 
     def mark_delivered(self) -> None:
         """Mark load as delivered."""
         self.status = LoadStatus.DELIVERED
-        self.delivered_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.delivered_at = now
+        self.updated_at = now
         self.add_tracking_update("Delivered at destination")
 
     def reject_haram(self, reason: str) -> None:
@@ -320,8 +315,9 @@ class Load(BaseModel):
         self.status = LoadStatus.REJECTED_HARAM
         self.halal_status = HalalStatus.HARAM
         self.halal_review_notes = reason
-        self.halal_reviewed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.halal_reviewed_at = now
+        self.updated_at = now
 
     def reject_rate(self, reason: str) -> None:
         """Reject load due to low rate."""
@@ -331,14 +327,15 @@ class Load(BaseModel):
 
     def add_tracking_update(self, message: str, location: Optional[str] = None) -> None:
         """Add a tracking update."""
+        now = datetime.utcnow()
         update = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "message": message,
             "location": location,
         }
         self.tracking_updates.append(update)
         self.current_status_note = message
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
 
     def to_embedding_text(self) -> str:
         """Generate text for vector embedding."""
@@ -352,17 +349,20 @@ class Load(BaseModel):
 
     def to_offer_text(self) -> str:
         """Generate text for offering load to carrier."""
-        lines = [
-            f"**{self.origin} -> {self.destination}**",
-            f"Miles: {self.loaded_miles} loaded + {self.deadhead_miles} DH",
-            f"Rate: ${self.rate:,.2f} (${self.rate_per_mile}/mi)",
-            f"Equipment: {self.equipment_type}",
-            f"Commodity: {self.commodity}",
-            f"Weight: {self.dimensions.weight_lbs:,} lbs",
-            f"Pickup: {self.pickup_window.earliest.strftime('%m/%d %H:%M')} - {self.pickup_window.latest.strftime('%H:%M')}",
-            f"Delivery: {self.delivery_window.earliest.strftime('%m/%d %H:%M')}",
-            f"Broker: {self.broker.company_name}",
-        ]
-        if self.special_requirements:
-            lines.append(f"Requirements: {', '.join(self.special_requirements)}")
-        return "\n".join(lines)
+        requirements = (
+            f"\nRequirements: {', '.join(self.special_requirements)}"
+            if self.special_requirements
+            else ""
+        )
+        return (
+            f"**{self.origin} -> {self.destination}**"
+            f"\nMiles: {self.loaded_miles} loaded + {self.deadhead_miles} DH"
+            f"\nRate: ${self.rate:,.2f} (${self.rate_per_mile}/mi)"
+            f"\nEquipment: {self.equipment_type}"
+            f"\nCommodity: {self.commodity}"
+            f"\nWeight: {self.dimensions.weight_lbs:,} lbs"
+            f"\nPickup: {self.pickup_window.earliest.strftime('%m/%d %H:%M')} - {self.pickup_window.latest.strftime('%H:%M')}"
+            f"\nDelivery: {self.delivery_window.earliest.strftime('%m/%d %H:%M')}"
+            f"\nBroker: {self.broker.company_name}"
+            f"{requirements}"
+        )
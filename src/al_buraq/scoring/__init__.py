@@ -1,5 +1,5 @@
 """Scoring algorithms for Al-Buraq dispatch system."""
 
-from .lead_scorer import LeadScorer, ScoringWeights, score_lead
+from .lead_scorer import LeadScorer, ScoringWeights, score_lead, score_leads_batch
 
-__all__ = ["LeadScorer", "ScoringWeights", "score_lead"]
+__all__ = ["LeadScorer", "ScoringWeights", "score_lead", "score_leads_batch"]
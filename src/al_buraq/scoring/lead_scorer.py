@@ -5,15 +5,18 @@ Scores and qualifies carrier leads based on likelihood of conversion
 and fit with our dispatch services.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
 from ..models.lead import Lead
-from ..models.enums import LeadStatus
+from ..models.enums import EquipmentType, LeadStatus
 from ..config import settings, TARGET_EQUIPMENT, TARGET_STATES
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoringWeights:
     """
     Configurable weights for lead scoring.
@@ -44,7 +47,7 @@ class ScoringWeights:
             raise ValueError(f"Scoring weights must sum to 1.0, got {total}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreBreakdown:
     """Detailed breakdown of lead score components."""
 
@@ -81,6 +84,27 @@ class ScoreBreakdown:
         }
 
 
+# Score ladders: each score applies from its lower bound up to (but
+# excluding) the next bound. Looked up with bisect in the scalar scorers
+# and with np.searchsorted in _score_batch.
+_AUTHORITY_AGE_BOUNDS = (30, 60, 90, 180, 365, 730)
+_AUTHORITY_AGE_SCORES = (1.0, 0.95, 0.90, 0.80, 0.60, 0.40, 0.20)
+_FLEET_SIZE_BOUNDS = (2, 3, 6, 11, 21, 51)
+_FLEET_SIZE_SCORES = (1.0, 0.95, 0.90, 0.75, 0.50, 0.35, 0.20)
+_SAFETY_BOUNDS = (30, 50, 70, 85)
+_SAFETY_SCORES = (1.0, 0.85, 0.60, 0.30, 0.10)
+_SCORE_BUCKET_BOUNDS = (0.4, 0.6, 0.8)
+
+# Contact quality by which details are present, indexed by
+# LeadScorer._contact_mask: phone is essential (0.50), email valuable
+# (0.30), a secondary phone a bonus (0.15) and an owner name helps
+# personalization (0.05)
+_CONTACT_SCORES = tuple(
+    min(1.0, 0.50 * (m >> 3 & 1) + 0.30 * (m >> 2 & 1) + 0.15 * (m >> 1 & 1) + 0.05 * (m & 1))
+    for m in range(16)
+)
+
+
 class LeadScorer:
     """
     Scores leads based on likelihood of conversion and fit.
@@ -113,8 +137,18 @@ class LeadScorer:
         """
         self.weights = weights or ScoringWeights()
         self.threshold = qualification_threshold or settings.LEAD_QUALIFICATION_THRESHOLD
-        self.target_equipment = target_equipment or TARGET_EQUIPMENT
-        self.target_states = target_states or TARGET_STATES
+        self.target_equipment = frozenset(target_equipment or TARGET_EQUIPMENT)
+        self.target_states = frozenset(target_states or TARGET_STATES)
+
+        # One bit per target equipment type, keyed by both the string value
+        # and the EquipmentType member, so matching a lead is an int AND
+        self._target_equipment_values = tuple(sorted(self.target_equipment))
+        self._equipment_bits = {
+            value: 1 << i for i, value in enumerate(self._target_equipment_values)
+        }
+        for member in EquipmentType:
+            if member.value in self._equipment_bits:
+                self._equipment_bits[member] = self._equipment_bits[member.value]
 
     def score_authority_age(self, age_days: int) -> float:
         """
@@ -122,20 +156,8 @@ class LeadScorer:
 
         New authorities are more receptive to dispatcher services.
         """
-        if age_days < 30:
-            return 1.0  # Brand new - very receptive
-        elif age_days < 60:
-            return 0.95
-        elif age_days < 90:
-            return 0.90
-        elif age_days < 180:
-            return 0.80
-        elif age_days < 365:
-            return 0.60
-        elif age_days < 730:
-            return 0.40
-        else:
-            return 0.20  # Established - less likely to switch
+        # Brand new (< 30 days) scores 1.0; established (2+ years) only 0.20
+        return _AUTHORITY_AGE_SCORES[bisect_right(_AUTHORITY_AGE_BOUNDS, age_days)]
 
     def score_fleet_size(self, truck_count: int) -> float:
         """
@@ -144,20 +166,11 @@ class LeadScorer:
         Sweet spot: 1-5 trucks (owner-operators)
         These carriers most need dispatch services.
         """
-        if truck_count == 1:
-            return 1.0  # Perfect target - solo owner-operator
-        elif truck_count == 2:
-            return 0.95
-        elif 3 <= truck_count <= 5:
-            return 0.90
-        elif 6 <= truck_count <= 10:
-            return 0.75
-        elif 11 <= truck_count <= 20:
-            return 0.50
-        elif 21 <= truck_count <= 50:
-            return 0.35
-        else:
-            return 0.20  # Large fleets usually have in-house dispatch
+        # Solo owner-operators score 1.0; large fleets usually have
+        # in-house dispatch and score 0.20
+        if truck_count < 1:
+            return 0.20
+        return _FLEET_SIZE_SCORES[bisect_right(_FLEET_SIZE_BOUNDS, truck_count)]
 
     def score_insurance(self, lead: Lead) -> float:
         """
@@ -207,21 +220,34 @@ class LeadScorer:
 
         Higher score if carrier has equipment we can dispatch.
         """
-        if not lead.fleet.equipment_types:
+        return self._score_equipment_match(
+            len(lead.fleet.equipment_types), self._equipment_mask(lead)
+        )
+
+    def _equipment_mask(self, lead: Lead) -> int:
+        """Bitmask of the target equipment types the lead has."""
+        bits = self._equipment_bits
+        mask = 0
+        for e in lead.fleet.equipment_types:
+            mask |= bits.get(e, 0)
+        return mask
+
+    def _matching_equipment(self, mask: int) -> list[str]:
+        """Target equipment values set in ``mask``."""
+        return [v for i, v in enumerate(self._target_equipment_values) if mask >> i & 1]
+
+    def _score_equipment_match(self, equipment_count: int, mask: int) -> float:
+        """Score from the lead's equipment count and target-equipment mask."""
+        if not equipment_count:
             return 0.3  # Unknown equipment
 
-        # Convert enum values to strings for comparison
-        equipment_set = set(
-            e.value if hasattr(e, 'value') else str(e)
-            for e in lead.fleet.equipment_types
-        )
-        matching = equipment_set & self.target_equipment
+        matching = mask.bit_count()
 
         if not matching:
             return 0.0  # No matching equipment
 
         # More matching equipment types = higher score
-        match_ratio = len(matching) / len(self.target_equipment)
+        match_ratio = matching / len(self.target_equipment)
         return min(1.0, 0.5 + match_ratio * 0.5)
 
     def score_location(self, lead: Lead) -> float:
@@ -230,9 +256,13 @@ class LeadScorer:
 
         Higher score if carrier operates in our target states.
         """
-        states_set = set(lead.fleet.operating_states)
-        matching_states = states_set & self.target_states
+        return self._score_location(
+            set(lead.fleet.operating_states) & self.target_states,
+            lead.fleet.home_base_state,
+        )
 
+    def _score_location(self, matching_states: set[str], home_base_state: Optional[str]) -> float:
+        """Score from the lead's operating states already intersected with ours."""
         if matching_states:
             # More matching states = higher score
             if len(matching_states) >= 5:
@@ -241,7 +271,7 @@ class LeadScorer:
                 return 0.85
             else:
                 return 0.70
-        elif lead.fleet.home_base_state in self.target_states:
+        elif home_base_state in self.target_states:
             return 0.50  # Home base in target area
         else:
             return 0.20  # Outside our primary area
@@ -252,25 +282,18 @@ class LeadScorer:
 
         Better contact info = easier to reach = higher score.
         """
-        score = 0.0
-
-        # Phone is essential
-        if lead.contact.phone_primary:
-            score += 0.50
-
-        # Email is valuable
-        if lead.contact.email:
-            score += 0.30
-
-        # Secondary phone is bonus
-        if lead.contact.phone_secondary:
-            score += 0.15
-
-        # Owner name helps personalization
-        if lead.owner_name:
-            score += 0.05
-
-        return min(1.0, score)
+        return _CONTACT_SCORES[self._contact_mask(lead)]
+
+    @staticmethod
+    def _contact_mask(lead: Lead) -> int:
+        """Bitmask of the contact details the lead has (see _CONTACT_SCORES)."""
+        contact = lead.contact
+        return (
+            bool(contact.phone_primary) << 3
+            | bool(contact.email) << 2
+            | bool(contact.phone_secondary) << 1
+            | bool(lead.owner_name)
+        )
 
     def score_lead(self, lead: Lead) -> tuple[float, ScoreBreakdown]:
         """
@@ -283,26 +306,28 @@ class LeadScorer:
             Tuple of (total_score, breakdown)
         """
         breakdown = ScoreBreakdown()
+        equipment_mask = self._equipment_mask(lead)
+        matching_states = set(lead.fleet.operating_states) & self.target_states
+        # Computed from the clock on each read; read once so score and insight agree
+        age_days = lead.authority.authority_age_days
 
         # Calculate individual component scores
-        breakdown.authority_age = self.score_authority_age(lead.authority.authority_age_days)
+        breakdown.authority_age = self.score_authority_age(age_days)
         breakdown.fleet_size = self.score_fleet_size(lead.fleet.truck_count)
         breakdown.insurance = self.score_insurance(lead)
         breakdown.safety = self.score_safety(lead)
-        breakdown.equipment_match = self.score_equipment_match(lead)
-        breakdown.location = self.score_location(lead)
+        breakdown.equipment_match = self._score_equipment_match(
+            len(lead.fleet.equipment_types), equipment_mask
+        )
+        breakdown.location = self._score_location(matching_states, lead.fleet.home_base_state)
         breakdown.contact_quality = self.score_contact_quality(lead)
 
         # Additional insights
-        breakdown.authority_age_days = lead.authority.authority_age_days
+        breakdown.authority_age_days = age_days
         breakdown.truck_count = lead.fleet.truck_count
         breakdown.meets_insurance_minimum = lead.insurance.meets_minimum_requirements
-        breakdown.matching_equipment = list(
-            set(str(e) for e in lead.fleet.equipment_types) & self.target_equipment
-        )
-        breakdown.matching_states = list(
-            set(lead.fleet.operating_states) & self.target_states
-        )
+        breakdown.matching_equipment = self._matching_equipment(equipment_mask)
+        breakdown.matching_states = list(matching_states)
 
         # Calculate weighted total
         total_score = (
@@ -317,6 +342,128 @@ class LeadScorer:
 
         return (round(total_score, 3), breakdown)
 
+    def score_leads_batch(self, leads: list[Lead]) -> np.ndarray:
+        """
+        Calculate total scores for many leads in one vectorized pass.
+
+        Produces the same totals as ``score_lead`` without building a
+        ScoreBreakdown per lead; use it to rank large batches.
+
+        Args:
+            leads: Leads to score
+
+        Returns:
+            Array of total scores, in the order of ``leads``
+        """
+        totals, _, _ = self._score_batch(leads)
+        return np.array(totals, dtype=float)
+
+    def _score_batch(
+        self, leads: list[Lead], insights: bool = False
+    ) -> tuple[list[float], np.ndarray, list[tuple]]:
+        """
+        Vectorized core of score_leads_batch and rank_leads.
+
+        Returns the rounded totals, an (N, 7) matrix of component scores in
+        ScoreBreakdown field order, and, if ``insights`` is set, the per-lead
+        ScoreBreakdown insight fields.
+        """
+        n = len(leads)
+        target_equipment = self.target_equipment
+        target_states = self.target_states
+        lead_insights = []
+
+        # One pass over the leads to lay their inputs out column-wise
+        columns = np.empty((n, 11))
+        for i, lead in enumerate(leads):
+            insurance = lead.insurance
+            equipment_mask = self._equipment_mask(lead)
+            matching_states = set(lead.fleet.operating_states) & target_states
+            safety = lead.safety.overall_safety_score if lead.safety is not None else None
+            age_days = lead.authority.authority_age_days
+            meets_insurance = insurance.meets_minimum_requirements
+            columns[i] = (
+                age_days,
+                lead.fleet.truck_count,
+                meets_insurance,
+                insurance.insurance_verified,
+                insurance.liability_coverage,
+                np.nan if safety is None else safety,
+                len(lead.fleet.equipment_types),
+                equipment_mask.bit_count(),
+                len(matching_states),
+                lead.fleet.home_base_state in target_states,
+                self._contact_mask(lead),
+            )
+            if insights:
+                lead_insights.append((
+                    age_days,
+                    lead.fleet.truck_count,
+                    meets_insurance,
+                    self._matching_equipment(equipment_mask),
+                    list(matching_states),
+                ))
+        (
+            age_days, trucks, meets_insurance, verified, liability, safety,
+            equipment_count, equipment_matches, state_matches, home_in_target, contact_mask,
+        ) = columns.T
+
+        authority_age = np.take(
+            _AUTHORITY_AGE_SCORES,
+            np.searchsorted(_AUTHORITY_AGE_BOUNDS, age_days, side="right"),
+        )
+        fleet_size = np.where(
+            trucks < 1,
+            0.20,
+            np.take(_FLEET_SIZE_SCORES, np.searchsorted(_FLEET_SIZE_BOUNDS, trucks, side="right")),
+        )
+        insurance = np.where(
+            meets_insurance == 0,
+            0.0,
+            np.where(verified == 1, 1.0, np.where(liability >= 1_500_000, 0.90, 0.75)),
+        )
+        safety = np.where(
+            np.isnan(safety),
+            0.5,
+            np.take(
+                _SAFETY_SCORES,
+                np.searchsorted(_SAFETY_BOUNDS, np.nan_to_num(safety), side="right"),
+            ),
+        )
+        equipment_match = np.where(
+            equipment_count == 0,
+            0.3,
+            np.where(
+                equipment_matches == 0,
+                0.0,
+                np.minimum(1.0, 0.5 + equipment_matches / len(target_equipment) * 0.5),
+            ),
+        )
+        location = np.select(
+            [state_matches >= 5, state_matches >= 3, state_matches >= 1, home_in_target == 1],
+            [1.0, 0.85, 0.70, 0.50],
+            default=0.20,
+        )
+        contact_quality = np.take(_CONTACT_SCORES, contact_mask.astype(np.intp))
+
+        # Summed term by term (not as a dot product) so totals match score_lead
+        w = self.weights
+        total = (
+            authority_age * w.authority_age
+            + fleet_size * w.fleet_size
+            + insurance * w.insurance
+            + safety * w.safety
+            + equipment_match * w.equipment_match
+            + location * w.location
+            + contact_quality * w.contact_quality
+        )
+        components = np.column_stack((
+            authority_age, fleet_size, insurance, safety,
+            equipment_match, location, contact_quality,
+        ))
+        # Python's round() is correctly rounded; np.round can differ on ties
+        return [round(t, 3) for t in total.tolist()], components, lead_insights
+
     def qualify_lead(self, lead: Lead) -> Lead:
         """
         Score and qualify a lead, updating the lead object.
@@ -328,10 +475,15 @@ class LeadScorer:
             The updated Lead object
         """
         total_score, breakdown = self.score_lead(lead)
+        self._apply_score(lead, total_score, breakdown)
+        return lead
 
+    def _apply_score(self, lead: Lead, total_score: float, breakdown: ScoreBreakdown) -> None:
+        """Record a score on the lead and qualify or disqualify it."""
         # Update lead with score
+        breakdown_dict = breakdown.to_dict()
         lead.lead_score = total_score
-        lead.score_breakdown = breakdown.to_dict()
+        lead.score_breakdown = breakdown_dict
 
         # Determine qualification
         is_qualified = True
@@ -353,12 +505,10 @@ class LeadScorer:
 
         # Update lead status
         if is_qualified:
-            lead.qualify(total_score, breakdown.to_dict())
+            lead.qualify(total_score, breakdown_dict)
         else:
             lead.disqualify(disqualification_reason)
 
-        return lead
-
     def rank_leads(self, leads: list[Lead]) -> list[Lead]:
         """
         Score and rank leads by score descending.
@@ -369,10 +519,15 @@ class LeadScorer:
         Returns:
             Sorted list of leads (highest score first)
         """
-        for lead in leads:
-            self.qualify_lead(lead)
+        totals, components, insights = self._score_batch(leads, insights=True)
+        for lead, total_score, row, lead_insights in zip(
+            leads, totals, components.tolist(), insights
+        ):
+            self._apply_score(lead, total_score, ScoreBreakdown(*row, *lead_insights))
 
-        return sorted(leads, key=lambda x: x.lead_score, reverse=True)
+        # Stable, like sorted(..., reverse=True): ties keep their input order
+        order = np.argsort(-np.array(totals, dtype=float), kind="stable")
+        return [leads[i] for i in order.tolist()]
 
     def get_qualification_summary(self, leads: list[Lead]) -> dict:
         """
@@ -394,21 +549,25 @@ class LeadScorer:
                 "top_score": 0.0,
             }
 
-        qualified = [l for l in leads if l.is_qualified]
+        qualified = sum(1 for l in leads if l.is_qualified)
         scores = [l.lead_score for l in leads]
+        # Bucket indices: 0 = < 0.4, 1 = [0.4, 0.6), 2 = [0.6, 0.8), 3 = >= 0.8
+        poor, fair, good, excellent = np.bincount(
+            np.searchsorted(_SCORE_BUCKET_BOUNDS, scores, side="right"), minlength=4
+        ).tolist()
 
         return {
             "total": len(leads),
-            "qualified": len(qualified),
-            "disqualified": len(leads) - len(qualified),
-            "qualification_rate": round(len(qualified) / len(leads), 3),
+            "qualified": qualified,
+            "disqualified": len(leads) - qualified,
+            "qualification_rate": round(qualified / len(leads), 3),
             "avg_score": round(sum(scores) / len(scores), 3),
             "top_score": max(scores),
             "score_distribution": {
-                "excellent": len([s for s in scores if s >= 0.8]),
-                "good": len([s for s in scores if 0.6 <= s < 0.8]),
-                "fair": len([s for s in scores if 0.4 <= s < 0.6]),
-                "poor": len([s for s in scores if s < 0.4]),
+                "excellent": excellent,
+                "good": good,
+                "fair": fair,
+                "poor": poor,
             },
         }
 
@@ -440,6 +599,11 @@ def qualify_lead(lead: Lead) -> Lead:
     return _scorer.qualify_lead(lead)
 
 
+def score_leads_batch(leads: list[Lead]) -> np.ndarray:
+    """Score many leads at once using default scorer."""
+    return _scorer.score_leads_batch(leads)
+
+
 # =============================================================================
 # Example Usage
 # =============================================================================
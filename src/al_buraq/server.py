@@ -17,16 +17,22 @@ USAGE:
 """
 
 import asyncio
+import json
+import logging
+import time
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from .agents import HunterAgent, InvestigatorAgent, DispatchAgent
-from .db import get_repository
-from .config import settings
+from .agents.dispatch_agent import DispatchRecommendation
+from .db import Repository, get_repository
+from .config import settings, uvicorn_log_config
+
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -169,6 +175,53 @@ app = FastAPI(
 )
 
 
+def _repository() -> Repository:
+    """
+    Return the repository shared by all requests.
+
+    Created once at startup; if that failed (e.g. the database was not
+    reachable yet), creation is retried on the next call.
+    """
+    repo = getattr(app.state, "repo", None)
+    if repo is None:
+        repo = app.state.repo = get_repository()
+    return repo
+
+
+def _hunter_agent() -> HunterAgent:
+    """Return the shared Hunter Agent, creating it on first use."""
+    agent = getattr(app.state, "hunter", None)
+    if agent is None:
+        agent = app.state.hunter = HunterAgent(repository=_repository())
+    return agent
+
+
+def _investigator_agent() -> InvestigatorAgent:
+    """Return the shared Investigator Agent, creating it on first use."""
+    agent = getattr(app.state, "investigator", None)
+    if agent is None:
+        agent = app.state.investigator = InvestigatorAgent(repository=_repository())
+    return agent
+
+
+def _dispatch_agent() -> DispatchAgent:
+    """Return the shared Dispatch Agent, creating it on first use."""
+    agent = getattr(app.state, "dispatcher", None)
+    if agent is None:
+        agent = app.state.dispatcher = DispatchAgent(repository=_repository())
+    return agent
+
+
+def _clear_stats_cache() -> None:
+    """Drop the cached /v1/stats response after this process writes data."""
+    app.state.stats_cache = None
+
+
+# Verification runs are throttled web searches through one shared client;
+# running two at once would defeat the per-search delay
+_verify_lock = asyncio.Lock()
+
+
 # =============================================================================
 # Health & Status Endpoints
 # =============================================================================
@@ -181,7 +234,8 @@ async def health_check():
     Returns system status, version, and database connectivity.
     """
     try:
-        repo = get_repository()
+        # The repository is shared, so check the database itself is reachable
+        await asyncio.to_thread(_repository().ping)
         db_connected = True
     except Exception:
         db_connected = False
@@ -207,6 +261,7 @@ async def root():
             "hunt": "POST /v1/agent/hunt",
             "verify": "POST /v1/agent/verify",
             "dispatch": "POST /v1/agent/dispatch",
+            "dispatch_stream": "POST /v1/agent/dispatch/stream",
             "leads": "GET /v1/leads/verified",
         },
     }
@@ -237,16 +292,21 @@ async def hunt_leads(request: HuntRequest):
         ```
     """
     try:
-        agent = HunterAgent()
+        agent = _hunter_agent()
 
         sources = [request.source] if request.source else None
 
-        session = await agent.hunt(
-            sources=sources,
-            limit_per_source=request.limit,
-            min_score=request.min_score,
-            save_results=request.save,
-        )
+        try:
+            session = await agent.hunt(
+                sources=sources,
+                limit_per_source=request.limit,
+                min_score=request.min_score,
+                save_results=request.save,
+            )
+        finally:
+            # Saved leads change the counts /v1/stats reports
+            if request.save:
+                _clear_stats_cache()
 
         return HuntResponse(
             success=True,
@@ -280,14 +340,20 @@ async def verify_leads(request: VerifyRequest):
         ```
     """
     try:
-        repo = get_repository()
-        agent = InvestigatorAgent(repository=repo)
-
-        # Run investigation synchronously (since it's already sync)
-        session = agent.investigate_batch(
-            limit=request.limit,
-            delay_seconds=request.delay_seconds,
-        )
+        agent = _investigator_agent()
+
+        # investigate_batch is sync and sleeps between searches; run it in a
+        # worker thread so the event loop keeps serving other requests
+        async with _verify_lock:
+            try:
+                session = await asyncio.to_thread(
+                    agent.investigate_batch,
+                    limit=request.limit,
+                    delay_seconds=request.delay_seconds,
+                )
+            finally:
+                # Each investigated lead is saved as it completes
+                _clear_stats_cache()
 
         return VerifyResponse(
             success=True,
@@ -323,41 +389,17 @@ async def dispatch_loads(request: DispatchRequest):
         ```
     """
     try:
-        repo = get_repository()
-        agent = DispatchAgent(repository=repo)
+        agent = _dispatch_agent()
 
-        session = agent.run_dispatch_session(
+        session = await asyncio.to_thread(
+            agent.run_dispatch_session,
             load_count=request.load_count,
             matches_per_load=request.matches_per_load,
             use_sample_loads=request.mock_mode,
         )
 
         # Convert recommendations to API format
-        recommendations = []
-        for rec in session.recommendations:
-            load = rec.load
-
-            matches = [
-                DispatchMatch(
-                    carrier_name=match.carrier_name,
-                    carrier_mc=match.carrier_mc,
-                    carrier_state=match.carrier_state,
-                    match_score=match.match_score,
-                    estimated_commission=match.estimated_commission,
-                    charity_contribution=match.charity_contribution,
-                    match_reasons=match.match_reasons,
-                )
-                for match in rec.matches
-            ]
-
-            recommendations.append(DispatchLoadRecommendation(
-                load_origin=f"{load.origin.city}, {load.origin.state}",
-                load_destination=f"{load.destination.city}, {load.destination.state}",
-                commodity=load.commodity,
-                rate=load.rate,
-                halal_status=rec.halal_status,
-                matches=matches,
-            ))
+        recommendations = [_to_load_recommendation(rec) for rec in session.recommendations]
 
         return DispatchResponse(
             success=True,
@@ -374,6 +416,62 @@ async def dispatch_loads(request: DispatchRequest):
         raise HTTPException(status_code=500, detail=f"Dispatch failed: {str(e)}")
 
 
+@app.post("/v1/agent/dispatch/stream", tags=["Agents"])
+async def dispatch_loads_stream(request: DispatchRequest):
+    """
+    Stream dispatch recommendations as NDJSON, one load per line.
+
+    Same matching as /v1/agent/dispatch, but each load's recommendation
+    (a DispatchLoadRecommendation object) is sent as soon as it is
+    matched instead of after the whole session.
+
+    Failures before the first line return a 500 as usual. A failure once
+    streaming has begun ends the stream with a final {"error": "..."} line.
+    """
+    try:
+        agent = _dispatch_agent()
+        loads = await asyncio.to_thread(agent.get_loads, request.load_count, request.mock_mode)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Dispatch failed: {str(e)}")
+
+    async def lines():
+        recommendations = agent.iter_recommendations(loads, request.matches_per_load)
+        try:
+            # Matching hits the database; advance the generator in a worker thread
+            while (rec := await asyncio.to_thread(next, recommendations, None)) is not None:
+                yield _to_load_recommendation(rec).model_dump_json() + "\n"
+        except Exception as e:
+            # The 200 status is already sent; report the failure in-band
+            logger.exception("Dispatch stream failed")
+            yield json.dumps({"error": f"Dispatch failed: {str(e)}"}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def _to_load_recommendation(rec: DispatchRecommendation) -> DispatchLoadRecommendation:
+    """Convert a DispatchAgent recommendation to its API model."""
+    load = rec.load
+    return DispatchLoadRecommendation(
+        load_origin=f"{load.origin.city}, {load.origin.state}",
+        load_destination=f"{load.destination.city}, {load.destination.state}",
+        commodity=load.commodity,
+        rate=load.rate,
+        halal_status=rec.halal_status,
+        matches=[
+            DispatchMatch(
+                carrier_name=match.carrier_name,
+                carrier_mc=match.carrier_mc,
+                carrier_state=match.carrier_state,
+                match_score=match.match_score,
+                estimated_commission=match.estimated_commission,
+                charity_contribution=match.charity_contribution,
+                match_reasons=match.match_reasons,
+            )
+            for match in rec.matches
+        ],
+    )
+
+
 # =============================================================================
 # Data Endpoints
 # =============================================================================
@@ -399,9 +497,9 @@ async def get_verified_leads(
         GET /v1/leads/verified?limit=50&social_verified=true
     """
     try:
-        repo = get_repository()
+        repo = _repository()
 
-        leads_list = repo.get_verified_leads(
+        rows = repo.get_verified_lead_rows(
             social_verified=social_verified,
             high_intent=high_intent,
             limit=limit,
@@ -409,32 +507,27 @@ async def get_verified_leads(
 
         # Convert to API format
         verified_leads = []
-        for lead in leads_list:
-            equipment = [
-                e.value if hasattr(e, 'value') else str(e)
-                for e in lead.fleet.equipment_types
-            ]
-
+        for row in rows:
             verified_leads.append(VerifiedLead(
-                id=lead.id,
-                company_name=lead.company_name,
-                mc_number=lead.authority.mc_number,
-                owner_name=lead.owner_name,
+                id=row["id"],
+                company_name=row["company_name"],
+                mc_number=row["mc_number"],
+                owner_name=row["owner_name"],
                 contact=LeadContact(
-                    email=lead.contact.email,
-                    phone=lead.contact.phone_primary,
+                    email=row["email"],
+                    phone=row["phone_primary"],
                 ),
-                state=lead.fleet.home_base_state,
-                truck_count=lead.fleet.truck_count,
-                equipment_types=equipment,
-                lead_score=lead.lead_score,
-                social_verified=lead.social_verified,
-                high_intent=lead.high_intent,
-                linkedin_url=lead.linkedin_url,
-                facebook_url=lead.facebook_url,
-                website_url=lead.website_url,
-                verification_status=lead.verification_status,
-                created_at=lead.created_at.isoformat() if lead.created_at else None,
+                state=row["home_base_state"],
+                truck_count=row["truck_count"],
+                equipment_types=row["equipment_types"],
+                lead_score=row["lead_score"],
+                social_verified=row["social_verified"],
+                high_intent=row["high_intent"],
+                linkedin_url=row["linkedin_url"],
+                facebook_url=row["facebook_url"],
+                website_url=row["website_url"],
+                verification_status=row["verification_status"],
+                created_at=row["created_at"].isoformat() if row["created_at"] else None,
             ))
 
         return VerifiedLeadsResponse(
@@ -460,13 +553,24 @@ async def get_stats():
     - Carrier counts (active, available)
     - Load counts (available, booked, delivered)
     - Verification statistics
+
+    Counts may be up to API_STATS_CACHE_TTL seconds (default 30) old; hunts
+    and verifications run through this server refresh them immediately.
     """
+    # The counts scan whole tables but change slowly; reuse a recent result
+    cached = getattr(app.state, "stats_cache", None)
+    if cached is not None and time.monotonic() - cached[0] < settings.API_STATS_CACHE_TTL:
+        return cached[1]
+
     try:
-        repo = get_repository()
-        db_stats = repo.get_stats()
-        v_stats = repo.get_verification_stats()
+        repo = _repository()
+        # Independent aggregates on their own sessions; run them side by side
+        db_stats, v_stats = await asyncio.gather(
+            asyncio.to_thread(repo.get_stats),
+            asyncio.to_thread(repo.get_verification_stats),
+        )
 
-        return {
+        stats = {
             "success": True,
             "leads": {
                 "total": db_stats["leads"]["total"],
@@ -483,6 +587,8 @@ async def get_stats():
             "carriers": db_stats["carriers"],
             "loads": db_stats["loads"],
         }
+        app.state.stats_cache = (time.monotonic(), stats)
+        return stats
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch stats: {str(e)}")
@@ -495,19 +601,28 @@ async def get_stats():
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
-    print("=" * 60)
-    print("Al-Buraq API Server Starting...")
-    print("=" * 60)
-    print(f"Version: {settings.APP_VERSION}")
-    print(f"Docs: http://localhost:8000/docs")
-    print(f"OpenAPI: http://localhost:8000/openapi.json")
-    print("=" * 60)
+    logger.info("Al-Buraq API Server Starting (version %s)", settings.APP_VERSION)
+    logger.info("Docs: http://localhost:8000/docs")
+    logger.info("OpenAPI: http://localhost:8000/openapi.json")
+
+    # Open the database and build the agents once; requests reuse them
+    try:
+        _repository()
+        _hunter_agent()
+        _investigator_agent()
+        _dispatch_agent()
+    except Exception as e:
+        logger.warning("Services unavailable at startup: %s", e)
+
+    # FastAPI caches the schema after the first build; build it now so the
+    # first /openapi.json or /docs request doesn't pay for it
+    app.openapi()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    print("Al-Buraq API Server Shutting Down...")
+    logger.info("Al-Buraq API Server Shutting Down...")
 
 
 # =============================================================================
@@ -521,6 +636,8 @@ if __name__ == "__main__":
         "al_buraq.server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=settings.API_WORKERS,
+        reload=settings.API_RELOAD,
         log_level="info",
+        log_config=uvicorn_log_config(),
     )
@@ -17,11 +17,11 @@ USAGE:
 """
 
 import sys
-import time
 import threading
 from typing import Optional
 
 from pyngrok import ngrok, conf
+from pyngrok.exception import PyngrokNgrokError
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -30,6 +30,20 @@ from rich.live import Live
 
 console = Console()
 
+# URL key -> path on the API server, as listed by TunnelManager.get_urls
+_ENDPOINT_PATHS = (
+    ("base", ""),
+    ("docs", "/docs"),
+    ("redoc", "/redoc"),
+    ("openapi", "/openapi.json"),
+    ("health", "/health"),
+    ("hunt", "/v1/agent/hunt"),
+    ("verify", "/v1/agent/verify"),
+    ("dispatch", "/v1/agent/dispatch"),
+    ("leads", "/v1/leads/verified"),
+    ("stats", "/v1/stats"),
+)
+
 
 class TunnelManager:
     """Manages ngrok tunnel for Al-Buraq API"""
@@ -47,6 +61,9 @@ class TunnelManager:
         self.tunnel = None
         self.public_url = None
         self.running = False
+        self._urls: dict = {}
+        self._stop_event = threading.Event()  # Set whenever not running
+        self._stop_event.set()
 
     def start(self, authtoken: Optional[str] = None) -> str:
         """
@@ -73,15 +90,18 @@ class TunnelManager:
             console.print("[cyan]Starting ngrok tunnel...[/cyan]")
             self.tunnel = ngrok.connect(self.port, bind_tls=True)
             self.public_url = self.tunnel.public_url
+            self._urls = self._build_urls(self.public_url)
             self.running = True
+            self._stop_event.clear()
 
             return self.public_url
 
-        except Exception as e:
-            error_msg = str(e)
+        except PyngrokNgrokError as e:
+            # ngrok's own error text: process output, or the API response body
+            detail = (e.ngrok_error or getattr(e, "body", None) or str(e)).lower()
 
             # Check for common errors
-            if "authtoken" in error_msg.lower() or "authentication" in error_msg.lower():
+            if "authtoken" in detail or "authentication" in detail:
                 console.print("\n[red]ERROR: ngrok authtoken not configured![/red]\n")
                 console.print("[yellow]To fix this:[/yellow]")
                 console.print("1. Sign up at https://ngrok.com (free)")
@@ -90,7 +110,7 @@ class TunnelManager:
                 console.print("4. Or pass it: alburaq share --authtoken YOUR_TOKEN\n")
                 raise Exception("ngrok authtoken required")
 
-            elif "already in use" in error_msg.lower():
+            elif "already in use" in detail:
                 console.print(f"\n[red]ERROR: Port {self.port} is already in use![/red]\n")
                 console.print("[yellow]Solutions:[/yellow]")
                 console.print(f"1. Stop the process using port {self.port}")
@@ -98,38 +118,33 @@ class TunnelManager:
                 raise Exception(f"Port {self.port} already in use")
 
             else:
-                console.print(f"\n[red]ERROR: Failed to start tunnel: {error_msg}[/red]\n")
+                console.print(f"\n[red]ERROR: Failed to start tunnel: {e}[/red]\n")
                 raise
 
+        except Exception as e:
+            console.print(f"\n[red]ERROR: Failed to start tunnel: {e}[/red]\n")
+            raise
+
     def stop(self):
         """Stop ngrok tunnel"""
         if self.tunnel:
             try:
                 ngrok.disconnect(self.tunnel.public_url)
                 self.running = False
+                self._stop_event.set()
                 console.print("[yellow]Tunnel stopped.[/yellow]")
             except Exception as e:
                 console.print(f"[red]Error stopping tunnel: {e}[/red]")
 
     def get_urls(self) -> dict:
-        """Get all relevant URLs for the tunnel"""
-        if not self.public_url:
-            return {}
-
-        base_url = self.public_url.replace("http://", "https://")  # Ensure HTTPS
-
-        return {
-            "base": base_url,
-            "docs": f"{base_url}/docs",
-            "redoc": f"{base_url}/redoc",
-            "openapi": f"{base_url}/openapi.json",
-            "health": f"{base_url}/health",
-            "hunt": f"{base_url}/v1/agent/hunt",
-            "verify": f"{base_url}/v1/agent/verify",
-            "dispatch": f"{base_url}/v1/agent/dispatch",
-            "leads": f"{base_url}/v1/leads/verified",
-            "stats": f"{base_url}/v1/stats",
-        }
+        """Get all relevant URLs for the tunnel (built once in start)"""
+        return self._urls
+
+    @staticmethod
+    def _build_urls(public_url: str) -> dict:
+        """Build the endpoint URLs for a tunnel's public URL"""
+        base_url = public_url.replace("http://", "https://")  # Ensure HTTPS
+        return {name: base_url + path for name, path in _ENDPOINT_PATHS}
 
     def display_info(self):
         """Display tunnel information in a nice format"""
@@ -179,8 +194,12 @@ class TunnelManager:
     def monitor(self):
         """Monitor tunnel status and keep it alive"""
         try:
-            while self.running:
-                time.sleep(1)
+            if sys.platform == "win32":
+                # Untimed waits can't be interrupted by Ctrl+C on Windows
+                while not self._stop_event.wait(1):
+                    pass
+            else:
+                self._stop_event.wait()
         except KeyboardInterrupt:
             console.print("\n[yellow]Stopping tunnel...[/yellow]")
             self.stop()
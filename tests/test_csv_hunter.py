@@ -0,0 +1,135 @@
+"""
+CSV Hunter Date Parsing Tests
+
+The column-wise date parser must accept exactly what the row-by-row
+parser accepts, and must never hand timezone-aware datetimes to scoring.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+
+from src.al_buraq.hunters.csv_hunter import CSVHunter
+
+
+class TestDateParsing:
+    """Vectorized date parsing matches _parse_date"""
+
+    def test_mixed_timezone_chunk(self):
+        """A "Z" timestamp next to plain dates must not abort the chunk"""
+        hunter = CSVHunter()
+        values = pd.Series(["2024-03-05T10:00:00Z", "2023-01-15", "01/02/2022", "2024", None])
+
+        parsed = hunter._parse_date_column(values)
+        dates = [hunter._get_date({"date": value}, "date") for value in parsed]
+
+        # Same results as the scalar parser: unsupported formats are skipped
+        assert dates == [None, datetime(2023, 1, 15), datetime(2022, 1, 2), None, None]
+
+    def test_get_date_is_naive(self):
+        """Scoring subtracts from naive datetimes; never return an aware one"""
+        hunter = CSVHunter()
+        value = pd.Timestamp("2024-03-05T10:00:00+05:00")
+
+        result = hunter._get_date({"date": value}, "date")
+
+        assert result == datetime(2024, 3, 5, 5, 0)
+        assert result.tzinfo is None
+
+
+class TestFieldCleaning:
+    """Scalar cleaners strip every non-digit, not just Latin-1 ones"""
+
+    def test_unicode_separators(self):
+        """En dashes and other non-Latin-1 separators are removed"""
+        hunter = CSVHunter()
+
+        assert hunter._clean_phone("(555) 123–4567") == "+15551234567"
+        assert hunter._clean_mc_dot("MC–123 456") == "123456"
+        assert hunter._clean_phone("555.123.4567") == "+15551234567"
+
+
+def _raw_chunk() -> pd.DataFrame:
+    """A chunk as import_csv reads it: every mapped column as strings"""
+    columns = [
+        "mc_number", "dot_number", "legal_name", "phone", "email",
+        "phy_city", "phy_state", "nbr_power_unit", "driver_total",
+        "mcs150_date", "cargo_carried", "carrier_operation",
+    ]
+    rows = [
+        # Valid, with an en dash in the phone and MC number
+        ["MC–123456", "1234567", "Acme Trucking", "(555) 123–4567", "Info@Acme.com",
+         "Dallas", "TX", "3", "3", "2024-01-15", "General Freight", "Interstate"],
+        # DOT only, 11-digit phone, US-style date
+        [None, "7654321", "Blue Line LLC", "1-555-222-3333", "ops@blueline.io",
+         "Reno", "NV", "1", "1", "03/05/2024", "Refrigerated Food", None],
+        # Missing email
+        ["MC-222222", "2222222", "No Mail Inc", "5551112222", None,
+         None, None, None, None, None, None, None],
+        # Phone too short
+        ["MC-333333", "3333333", "Short Phone Co", "555-1234", "a@b.com",
+         None, None, None, None, None, None, None],
+        # MC/DOT with no digits at all
+        ["MC–", None, "No Number Co", "5551112222", "a@b.com",
+         None, None, None, None, None, None, None],
+        # Blank name
+        ["MC-444444", "4444444", "   ", "5551112222", "a@b.com",
+         None, None, None, None, None, None, None],
+        # Invalid email
+        ["MC-555555", "5555555", "Bad Mail Co", "5551112222", "not-an-email",
+         None, None, None, None, None, None, None],
+    ]
+    return pd.DataFrame(rows, columns=columns, dtype="object")
+
+
+def _comparable(lead):
+    """Lead fields that don't depend on when or where it was built"""
+    if lead is None:
+        return None
+    return lead.model_dump(exclude={"id", "created_at", "updated_at", "scraped_at"})
+
+
+class TestChunkDecoding:
+    """Column-wise cleaning and decoding match the scalar row_to_lead path"""
+
+    def test_clean_chunk(self):
+        """MC/DOT and phone lose every non-digit, including en dashes"""
+        hunter = CSVHunter()
+        chunk = _raw_chunk()
+        mapping = hunter.detect_columns(chunk)
+
+        cleaned = hunter._clean_chunk(chunk.copy(), mapping)
+
+        assert cleaned["mc_number"].iloc[0] == "123456"
+        assert pd.isna(cleaned["mc_number"].iloc[4])
+        assert cleaned["phone"].tolist()[:2] == ["+15551234567", "+15552223333"]
+        assert pd.isna(cleaned["phone"].iloc[3])
+        assert cleaned["email"].iloc[0] == "info@acme.com"
+        assert pd.isna(cleaned["email"].iloc[6])
+
+    def test_candidate_mask(self):
+        """Only rows that pass cleaning remain candidates"""
+        hunter = CSVHunter()
+        chunk = _raw_chunk()
+        mapping = hunter.detect_columns(chunk)
+
+        # Raw presence check: missing email is the only absent required value
+        raw = hunter._candidate_mask(chunk, mapping)
+        assert raw.tolist() == [True, True, False, True, True, False, True]
+
+        cleaned = hunter._clean_chunk(chunk.copy(), mapping)
+        mask = hunter._candidate_mask(cleaned, mapping)
+        assert mask.tolist() == [True, True, False, False, False, False, False]
+
+    def test_decoded_leads_match_row_to_lead(self):
+        """Chunk decoding produces the same leads as row-by-row conversion"""
+        hunter = CSVHunter()
+        chunk = _raw_chunk()
+        mapping = hunter.detect_columns(chunk)
+
+        expected = [hunter.row_to_lead(row, mapping) for _, row in chunk.iterrows()]
+        decode = hunter._compile_decoder(mapping, chunk.columns)
+        decoded = list(hunter._decode_rows(chunk, mapping, decode))
+
+        assert [_comparable(lead) for lead in decoded] == [_comparable(lead) for lead in expected]
+        assert [lead is not None for lead in decoded] == [True, True] + [False] * 5
@@ -0,0 +1,138 @@
+"""
+Lead Scorer Tests
+
+The vectorized batch path (score_leads_batch, rank_leads) must agree
+exactly with the scalar score_lead/qualify_lead path.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from src.al_buraq.models import (
+    AuthorityInfo, ContactInfo, FleetInfo, InsuranceInfo, Lead, LeadSource, SafetyInfo,
+)
+from src.al_buraq.models.enums import EquipmentType
+from src.al_buraq.scoring import LeadScorer
+
+
+def _make_leads(count: int = 300, seed: int = 7) -> list[Lead]:
+    """Varied leads, with values on every ladder boundary and exact duplicates"""
+    rng = random.Random(seed)
+    # Ladder bounds and their neighbours, so bisect/searchsorted edges are hit
+    ages = [None, 0, 29, 30, 59, 60, 90, 179, 180, 365, 729, 730, 2000]
+    trucks = [1, 2, 3, 5, 6, 10, 11, 20, 21, 50, 51, 200]
+    safety_scores = [None, 0.0, 29.9, 30.0, 50.0, 69.9, 70.0, 85.0, 99.0]
+    equipment = list(EquipmentType)
+    states = ["TX", "CA", "FL", "IL", "GA", "OH", "NY", "MT", "WY", "ND", "VT"]
+
+    leads = []
+    for n in range(count):
+        age = rng.choice(ages)
+        # Half a day off the boundary so both paths read the same day count
+        granted = None if age is None else datetime.utcnow() - timedelta(days=age, hours=12)
+        safety_score = rng.choice(safety_scores)
+        leads.append(Lead(
+            company_name=f"Carrier {n}",
+            owner_name=rng.choice([None, "Owner"]),
+            contact=ContactInfo(
+                phone_primary=f"555555{n:04d}",
+                phone_secondary=rng.choice([None, "5550001111"]),
+                email=rng.choice([None, f"c{n}@example.com"]),
+            ),
+            authority=AuthorityInfo(
+                mc_number=f"{100000 + n}",
+                dot_number=f"{2000000 + n}",
+                authority_granted_date=granted,
+            ),
+            insurance=InsuranceInfo(
+                liability_coverage=rng.choice([0, 750_000, 1_000_000, 1_500_000, 2_000_000]),
+                cargo_coverage=rng.choice([0, 100_000, 250_000]),
+                insurance_verified=rng.random() < 0.3,
+            ),
+            fleet=FleetInfo(
+                truck_count=rng.choice(trucks),
+                equipment_types=rng.sample(equipment, rng.randint(0, 4)),
+                operating_states=rng.sample(states, rng.randint(0, 7)),
+                home_base_state=rng.choice([None, "TX", "MT"]),
+            ),
+            safety=None if safety_score is None else SafetyInfo(unsafe_driving_score=safety_score),
+            source=LeadSource.FMCSA_SAFER,
+        ))
+
+    # Copies with new ids score identically: guaranteed ties for ranking
+    leads += [
+        lead.model_copy(update={"id": f"dup-{i}"}, deep=True)
+        for i, lead in enumerate(rng.sample(leads, 40))
+    ]
+    rng.shuffle(leads)
+    return leads
+
+
+def _copies(leads: list[Lead]) -> list[Lead]:
+    return [lead.model_copy(deep=True) for lead in leads]
+
+
+def _outcome(lead: Lead) -> dict:
+    """What qualification records on a lead"""
+    breakdown = dict(lead.score_breakdown)
+    breakdown["matching_states"] = sorted(breakdown.get("matching_states", []))
+    return {
+        "lead_score": lead.lead_score,
+        "score_breakdown": breakdown,
+        "is_qualified": lead.is_qualified,
+        "status": lead.status,
+        "disqualification_reason": lead.disqualification_reason,
+    }
+
+
+class TestBatchScoring:
+    """score_leads_batch and rank_leads match the scalar scorer"""
+
+    def test_totals_match_score_lead(self):
+        scorer = LeadScorer()
+        leads = _make_leads()
+
+        batch = scorer.score_leads_batch(leads).tolist()
+
+        assert batch == [scorer.score_lead(lead)[0] for lead in leads]
+
+    def test_breakdowns_match_qualify_lead(self):
+        scorer = LeadScorer()
+        leads = _make_leads()
+        scalar = [scorer.qualify_lead(lead) for lead in _copies(leads)]
+
+        ranked = scorer.rank_leads(_copies(leads))
+
+        by_id = {lead.id: lead for lead in ranked}
+        assert [_outcome(by_id[lead.id]) for lead in scalar] == [_outcome(lead) for lead in scalar]
+        assert {lead.is_qualified for lead in scalar} == {True, False}
+
+    def test_ranking_order_with_ties(self):
+        """Highest score first; equal scores keep their input order"""
+        scorer = LeadScorer()
+        leads = _make_leads()
+        scalar = [scorer.qualify_lead(lead) for lead in _copies(leads)]
+        expected = sorted(scalar, key=lambda lead: lead.lead_score, reverse=True)
+
+        ranked = scorer.rank_leads(_copies(leads))
+
+        assert [lead.id for lead in ranked] == [lead.id for lead in expected]
+        scores = [lead.lead_score for lead in ranked]
+        assert len(set(scores)) < len(scores)
+
+    def test_qualification_summary(self):
+        scorer = LeadScorer()
+        leads = _make_leads()
+        scalar = [scorer.qualify_lead(lead) for lead in _copies(leads)]
+        ranked = scorer.rank_leads(_copies(leads))
+
+        summary = scorer.get_qualification_summary(ranked)
+
+        assert summary == scorer.get_qualification_summary(scalar)
+        scores = [lead.lead_score for lead in scalar]
+        assert summary["score_distribution"] == {
+            "excellent": sum(s >= 0.8 for s in scores),
+            "good": sum(0.6 <= s < 0.8 for s in scores),
+            "fair": sum(0.4 <= s < 0.6 for s in scores),
+            "poor": sum(s < 0.4 for s in scores),
+        }
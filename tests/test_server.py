@@ -0,0 +1,175 @@
+"""
+API Server Tests
+
+Exercise the FastAPI endpoints against a throwaway SQLite database.
+The client is used without its context manager so startup does not
+build the agents (and their vector store); each test installs what
+it needs on app.state.
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from src.al_buraq.agents import DispatchAgent
+from src.al_buraq.agents.investigator_agent import InvestigationSession
+from src.al_buraq.config import settings
+from src.al_buraq.db import Repository
+from src.al_buraq.models import AuthorityInfo, ContactInfo, Lead, LeadSource
+from src.al_buraq.server import DispatchLoadRecommendation, _to_load_recommendation, app
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = Repository(database_url=f"sqlite:///{tmp_path / 'test.db'}")
+    repository.init_db()
+    app.state.repo = repository
+    yield repository
+    for name in ("repo", "stats_cache", "dispatcher", "investigator"):
+        if hasattr(app.state, name):
+            delattr(app.state, name)
+
+
+@pytest.fixture
+def client(repo):
+    return TestClient(app)
+
+
+class TestHealth:
+    """/health reports whether the database actually answers"""
+
+    def test_healthy(self, client):
+        body = client.get("/health").json()
+
+        assert body["status"] == "healthy"
+        assert body["database_connected"] is True
+
+    def test_unreachable_database(self, client, repo, tmp_path):
+        # Read-only open of a missing file fails on every connect
+        missing = tmp_path / "missing.db"
+        repo.engine = create_engine(f"sqlite:///file:{missing}?mode=ro&uri=true")
+
+        body = client.get("/health").json()
+
+        assert body["status"] == "degraded"
+        assert body["database_connected"] is False
+
+
+def _lead(n: int) -> Lead:
+    """A minimal valid lead with distinct MC/DOT numbers"""
+    return Lead(
+        company_name=f"Carrier {n}",
+        contact=ContactInfo(phone_primary=f"555555{n:04d}"),
+        authority=AuthorityInfo(mc_number=f"{100000 + n}", dot_number=f"{2000000 + n}"),
+        source=LeadSource.FMCSA_SAFER,
+    )
+
+
+class TestStatsCache:
+    """/v1/stats reuses a recent result until it expires or this server writes"""
+
+    def test_cache_hit(self, client, repo):
+        assert client.get("/v1/stats").json()["leads"]["total"] == 0
+
+        repo.save_lead(_lead(1))
+
+        # Written behind the server's back: the cached counts are served
+        assert client.get("/v1/stats").json()["leads"]["total"] == 0
+
+    def test_ttl_expiry(self, client, repo, monkeypatch):
+        assert client.get("/v1/stats").json()["leads"]["total"] == 0
+
+        repo.save_lead(_lead(1))
+        monkeypatch.setattr(settings, "API_STATS_CACHE_TTL", 0)
+
+        assert client.get("/v1/stats").json()["leads"]["total"] == 1
+
+    def test_cleared_on_write(self, client, repo):
+        class Investigator:
+            def investigate_batch(self, limit, delay_seconds):
+                repo.save_lead(_lead(1))
+                return InvestigationSession(total_investigated=1)
+
+        app.state.investigator = Investigator()
+        assert client.get("/v1/stats").json()["leads"]["total"] == 0
+
+        response = client.post("/v1/agent/verify", json={"limit": 1, "delay_seconds": 1})
+        assert response.status_code == 200
+
+        assert client.get("/v1/stats").json()["leads"]["total"] == 1
+
+    def test_cleared_when_write_fails(self, client, repo):
+        class Investigator:
+            def investigate_batch(self, limit, delay_seconds):
+                repo.save_lead(_lead(1))
+                raise RuntimeError("search blocked")
+
+        app.state.investigator = Investigator()
+        assert client.get("/v1/stats").json()["leads"]["total"] == 0
+
+        response = client.post("/v1/agent/verify", json={"limit": 1, "delay_seconds": 1})
+        assert response.status_code == 500
+
+        # Leads saved before the failure still show up
+        assert client.get("/v1/stats").json()["leads"]["total"] == 1
+
+
+class TestDispatchStream:
+    """/v1/agent/dispatch/stream sends one NDJSON line per load"""
+
+    REQUEST = {"load_count": 4, "matches_per_load": 2, "mock_mode": True}
+
+    @pytest.fixture
+    def agent(self, repo):
+        agent = DispatchAgent(repository=repo)
+        loads = agent.create_sample_loads(4)
+        # Sample loads are random; hand the endpoint the same ones every call
+        agent.get_loads = lambda load_count, use_sample_loads: loads
+        app.state.dispatcher = agent
+        return agent
+
+    def _read(self, client):
+        with client.stream("POST", "/v1/agent/dispatch/stream", json=self.REQUEST) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            body = "".join(response.iter_text())
+        assert body.endswith("\n")
+        return body.splitlines()
+
+    def test_one_line_per_load(self, client, agent):
+        lines = self._read(client)
+
+        loads = agent.get_loads(4, True)
+        expected = [
+            _to_load_recommendation(rec).model_dump()
+            for rec in agent.iter_recommendations(loads, 2)
+        ]
+        assert [DispatchLoadRecommendation.model_validate_json(line).model_dump() for line in lines] == expected
+
+    def test_error_before_streaming(self, client, agent):
+        def get_loads(load_count, use_sample_loads):
+            raise RuntimeError("load board down")
+
+        agent.get_loads = get_loads
+
+        response = client.post("/v1/agent/dispatch/stream", json=self.REQUEST)
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Dispatch failed: load board down"
+
+    def test_error_mid_stream(self, client, agent):
+        iter_recommendations = agent.iter_recommendations
+
+        def failing(loads, matches_per_load):
+            yield next(iter_recommendations(loads, matches_per_load))
+            raise RuntimeError("database gone")
+
+        agent.iter_recommendations = failing
+
+        lines = self._read(client)
+
+        assert len(lines) == 2
+        DispatchLoadRecommendation.model_validate_json(lines[0])
+        assert json.loads(lines[1]) == {"error": "Dispatch failed: database gone"}